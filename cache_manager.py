@@ -269,6 +269,28 @@ class CacheManager:
                     pass
             self._save()
 
+    def clear(self) -> List[str]:
+        """Delete everything in the cache folder; return "name: reason" for each entry that could not be removed"""
+        failures: List[str] = []
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.path == self.index_path:
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.remove(entry.path)
+                    except OSError as e:
+                        failures.append(f"{entry.name}: {e.strerror or e}")
+            # Keep entries whose file survived (e.g. locked) so the index still matches the disk
+            self._index["items"] = [item for item in self._index.get("items", [])
+                                    if item.get("path") and os.path.exists(item["path"])]
+            self._save()
+        return failures
+
     def open_folder(self) -> None:
         try:
             os.startfile(self.directory)
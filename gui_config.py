@@ -1,17 +1,321 @@
 import ast
+import hashlib
+import io
 import json
+import logging
 import os
-import pprint
+import queue
+import re
+import textwrap
+import threading
+import time
 import tkinter as tk
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from tkinter import ttk, messagebox, scrolledtext
-from typing import Any, Dict, List, Optional, Tuple
+from tkinter import font as tkfont
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import requests
 from PIL import Image, ImageTk
+from PIL.PngImagePlugin import PngInfo
 
 from cache_manager import CacheManager
 from config import CacheSettings
 
+logger = logging.getLogger(__name__)
+
+# Log lines carrying a level the log viewer colors
+_LOG_RE = re.compile(r'^.*? - (INFO|WARNING|ERROR|DEBUG) - .*$', re.M)
+# Accepted text for numeric entry fields
+_INT_RE = re.compile(r'\d*')
+_NUM_RE = re.compile(r'-?\d*(?:\.\d*)?')
+# Name of a top-level "Name = value" assignment in config.py
+_CONFIG_KEY_RE = re.compile(r'\s*([A-Za-z_]\w*)\s*=(?!=)')
+# Quoted key of a "key": value line inside a config.py dict
+_DICT_KEY_RE = re.compile(r'\s*["\']([A-Za-z_]\w*)["\']\s*:')
+# API key assignments read from .env
+_ENV_RE = re.compile(r'^(WALLHAVEN_API_KEY|PEXELS_API_KEY|OPENWEATHER_API_KEY)=(.*)$', re.M)
+# .env contents written by "Save API Keys"
+_ENV_TEMPLATE = """# Wallhaven API Key from https://wallhaven.cc/settings/account
+WALLHAVEN_API_KEY={wallhaven}
+
+# Pexels API Key from https://www.pexels.com/api/new/
+PEXELS_API_KEY={pexels}
+
+# OpenWeatherMap API Key from https://home.openweathermap.org/api_keys
+# Free tier: 1000 calls/day (more than enough!)
+OPENWEATHER_API_KEY={openweather}
+"""
+
+# Image file extensions counted in the cache folder
+_IMG_EXTS = frozenset({"jpg", "jpeg", "png", "bmp"})
+
+# Monitors section appended when config.py has none
+_DEFAULT_MONITORS_BLOCK = """
+Monitors = [
+    {
+        "name": "Full HD",
+        "preset": "workspace",
+        "provider": "",
+        "query": "",
+        "screen_resolution": "1920x1080",
+        "purity": "100",
+        "wallhaven_sorting": "random",
+        "wallhaven_top_range": "1M",
+    },
+]
+"""
+
+
+# Static text for the advanced tab info box and the Help tab
+_INFO_TEXT = (
+    "• API Keys are stored securely in the .env file\n"
+    "• Cache directory stores downloaded wallpapers\n"
+    "• Quiet hours prevent wallpaper changes during specified times\n"
+    "• Active days control which days the scheduler runs\n"
+    "• All changes require clicking 'Save Configuration' at the bottom"
+)
+
+_WEATHER_INTRO = (
+    "Weather Rotation permette di cambiare automaticamente il wallpaper in base alle condizioni meteo della tua posizione. "
+    "Puoi mappare diverse condizioni meteo (sole, pioggia, neve, ecc.) a preset o playlist specifici, creando "
+    "un'esperienza visiva che si adatta all'ambiente esterno."
+)
+
+_SETUP_STEPS = (
+    "1. Ottieni un API key gratuita da OpenWeatherMap (https://openweathermap.org/api)",
+    "2. Aggiungi la key nel file .env come OPENWEATHER_API_KEY=your_key_here",
+    "3. Nel tab 'Advanced', configura la sezione Weather Rotation:",
+    "   • Abilita Weather Rotation",
+    "   • Imposta la tua posizione (città o coordinate)",
+    "   • Scegli quando applicare la rotazione (startup, scheduler, hotkey)",
+    "   • Imposta l'intervallo di refresh (es. 30 minuti)",
+    "4. Configura le mappature meteo → preset/playlist nella sezione 'Weather Mapping'",
+)
+
+_WEATHER_CONDITIONS_HELP = (
+    "• clear          → Cielo sereno",
+    "• clouds         → Nuvoloso",
+    "• rain           → Pioggia",
+    "• drizzle        → Pioggerella",
+    "• snow           → Neve",
+    "• thunderstorm   → Temporale",
+    "• mist/fog       → Nebbia",
+    "• storm          → Tempesta",
+    "• night_clear    → Notte serena (usa il prefisso 'night_' per condizioni notturne)",
+    "• default        → Fallback per condizioni non mappate",
+)
+
+_WEATHER_EXAMPLE_CFG = (
+    'WeatherRotationSettings = {',
+    '    "enabled": True,',
+    '    "provider": "openweathermap",',
+    '    "api_key": os.getenv("OPENWEATHER_API_KEY"),',
+    '    "refresh_minutes": 30,',
+    '    "apply_on": ["startup", "scheduler", "hotkey"],',
+    '    "units": "metric",',
+    '    "location": {',
+    '        "city": "Milan",',
+    '        "country": "IT",',
+    '    },',
+    '    "conditions": {',
+    '        "clear": {"playlist": "focus_day"},',
+    '        "night_clear": {"playlist": "after_hours"},',
+    '        "rain": {"preset": "relax"},',
+    '        "snow": {"preset": "relax"},',
+    '        "default": {"playlist": "focus_day"},',
+    '    },',
+    '}',
+)
+
+_PLAYLIST_INTRO = (
+    "Le Playlist permettono di creare sequenze tematiche di preset che vengono applicati in rotazione. "
+    "Ogni entry nella playlist può avere un 'weight' (peso) che determina quante volte appare nella sequenza, "
+    "override per monitor specifici, e provider/query personalizzati. Ideali per creare esperienze contestuali "
+    "(es. focus durante il giorno, relax la sera)."
+)
+
+_STRUCTURE_POINTS = (
+    "• name: Identificatore univoco (lowercase)",
+    "• title: Nome visualizzato nell'interfaccia",
+    "• description: Breve descrizione dello scopo",
+    "• tags: Array di tag per categorizzare",
+    "• entries: Array di step che compongono la playlist",
+)
+
+_ENTRY_POINTS = (
+    "• preset: Nome del preset da utilizzare (richiesto)",
+    "• weight: Numero di volte che appare in rotazione (default: 1)",
+    "• provider: Override del provider per questo step (opzionale)",
+    "• query: Query specifica per questo step (opzionale)",
+    "• title: Titolo descrittivo dello step (opzionale)",
+    "• monitors: Override specifici per monitor (opzionale)",
+)
+
+_PLAYLIST_EXAMPLE = (
+    'Playlists = [',
+    '    {',
+    '        "name": "focus_day",',
+    '        "title": "Focus Daylight",',
+    '        "description": "Rotazione energizzante per il giorno",',
+    '        "tags": ["daytime", "focus"],',
+    '        "entries": [',
+    '            {',
+    '                "title": "Deep Focus",',
+    '                "preset": "workspace",',
+    '                "weight": 3,  # Appare 3 volte su 4',
+    '                "provider": "wallhaven",',
+    '                "monitors": {',
+    '                    "0": {"preset": "workspace"},  # Monitor index',
+    '                    "Full HD": {"provider": "wallhaven"},  # Monitor name',
+    '                    "Ultrawide": {"query": "technology"},',
+    '                },',
+    '            },',
+    '            {',
+    '                "title": "Mental Break",',
+    '                "preset": "relax",',
+    '                "weight": 1,  # Appare 1 volta su 4',
+    '                "provider": "pexels",',
+    '                "query": "nature landscape",',
+    '            },',
+    '        ],',
+    '    },',
+    ']',
+    '',
+    '# Imposta la playlist di default',
+    'DefaultPlaylist = "focus_day"',
+)
+
+_USAGE_STEPS = (
+    "1. Definisci le tue playlist nell'array 'Playlists' in config.py",
+    "2. Imposta 'DefaultPlaylist' con il nome di una playlist (opzionale)",
+    "3. Usa Weather Rotation per mappare condizioni meteo a playlist specifiche",
+    "4. Il sistema ruoterà automaticamente tra gli step della playlist attiva",
+    "5. Gli step con weight maggiore appariranno più frequentemente nella rotazione",
+)
+
+_TIPS_LINES = (
+    "✓ Combina Weather Rotation e Playlist per esperienze contestuali automatiche",
+    "✓ Usa weight elevati per preset preferiti che vuoi vedere più spesso",
+    "✓ Gli override per monitor permettono configurazioni diverse per ogni schermo",
+    "✓ Testa le configurazioni meteo usando diverse condizioni nel tab Advanced",
+    "✓ Refresh meteo ogni 30-60 minuti è sufficiente per la maggior parte degli usi",
+    "✓ Crea playlist tematiche (focus, relax, serale) per diverse situazioni",
+    "✓ Usa il prefisso 'night_' nelle condizioni meteo per wallpaper notturni specifici",
+)
+
+
+def _log_runs(text: str) -> List[list]:
+    """Split log text into [start, end, tag] runs of consecutive lines sharing a level tag"""
+    runs: List[list] = []
+    pos = 0
+    for match in _LOG_RE.finditer(text):
+        start, end, tag = match.start(), match.end() + 1, match.group(1)
+        if start > pos:
+            runs.append([pos, start, ""])
+        if runs and runs[-1][2] == tag and runs[-1][1] == start:
+            runs[-1][1] = end
+        else:
+            runs.append([start, end, tag])
+        pos = end
+    if pos < len(text):
+        runs.append([pos, len(text), ""])
+    return runs
+
+
+class _RawCode(str):
+    """String that _dump_literal writes verbatim, for expressions such as os.getenv(...)"""
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def _dump_literal(value: Any, indent: int = 0, width: int = 100) -> str:
+    """Format a literal config.py style: inline when it fits, otherwise one item per line"""
+    flat = repr(value)
+    if not isinstance(value, (dict, list, tuple)) or not value or indent + len(flat) <= width:
+        return flat
+    pad = " " * (indent + 4)
+    if isinstance(value, dict):
+        items = [f"{pad}{key!r}: {_dump_literal(item, indent + 4, width)}," for key, item in value.items()]
+        opening, closing = "{", "}"
+    else:
+        items = [f"{pad}{_dump_literal(item, indent + 4, width)}," for item in value]
+        opening, closing = ("[", "]") if isinstance(value, list) else ("(", ")")
+    return opening + "\n" + "\n".join(items) + "\n" + " " * indent + closing
+
+
+def _reject_json_constant(name: str) -> Any:
+    """json.loads parse_constant hook: NaN/Infinity would be written out as bare nan/inf names"""
+    raise ValueError(f"{name} is not a Python literal")
+
+
+def _parse_literal(raw: str) -> Any:
+    """Parse editor text, trying the fast JSON parser before Python literal syntax"""
+    try:
+        return json.loads(raw, parse_constant=_reject_json_constant)
+    except ValueError:
+        return ast.literal_eval(raw)
+
+
+def _parse_config_literals(content: str) -> Dict[str, Any]:
+    """Parse config.py source once and map each top-level literal assignment to its value"""
+    values: Dict[str, Any] = {}
+    for node in ast.parse(content).body:
+        if not isinstance(node, ast.Assign):
+            continue
+        try:
+            value = ast.literal_eval(node.value)
+        except (ValueError, TypeError, SyntaxError):
+            continue  # Not a literal, e.g. os.getenv(...)
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                values[target.id] = value
+    return values
+
+
+@lru_cache(maxsize=32)
+def _reformat_literal(raw: str) -> str:
+    """Parse editor text as a literal and return its formatted form; parse errors propagate"""
+    # Only the immutable string is cached, never the parsed value
+    return _dump_literal(_parse_literal(raw))
+
+
+def _write_file_atomic(path: Path, text: str) -> None:
+    """Write a sibling .tmp file and swap it in, so a crash never leaves path half written"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _entries_key(entries: List[Dict[str, Any]]) -> Tuple:
+    """Identity of a cache listing, used to skip re-rendering an unchanged gallery"""
+    return tuple((e.get("path"), e.get("source_info", "")) for e in entries)
+
+
+@lru_cache(maxsize=None)
+def _system_parameters_info() -> Callable[..., int]:
+    """Return user32.SystemParametersInfoW with its prototype declared; bound on first use (Windows only)"""
+    import ctypes
+    from ctypes import wintypes
+
+    spi = ctypes.windll.user32.SystemParametersInfoW
+    spi.argtypes = [wintypes.UINT, wintypes.UINT, wintypes.LPCWSTR, wintypes.UINT]
+    spi.restype = wintypes.BOOL
+    return spi
+
 
 class WallpaperConfigGUI:
     # Modern color scheme - Enhanced with gradients
@@ -38,6 +342,47 @@ class WallpaperConfigGUI:
         'overlay_bg': 'rgba(0, 0, 0, 0.7)',
     }
 
+    # Read-only combobox choices
+    _PROVIDERS = ("wallhaven", "pexels", "reddit")
+    _PURITY_CHOICES = ("100", "110", "111", "010", "001")
+    _RESOLUTIONS = ("1920x1080", "2560x1440", "3440x1440", "3840x2160")
+    _MONITOR_RESOLUTIONS = _RESOLUTIONS + ("5120x1440",)
+    _SORT_OPTIONS = ("random", "toplist", "favorites", "views")
+    _TOP_RANGES = ("1d", "3d", "1w", "1M", "3M", "6M", "1y")
+    _PEXELS_MODES = ("search", "curated")
+    _REDDIT_SORTS = ("hot", "new", "rising", "top", "controversial")
+    _TIME_FILTERS = ("hour", "day", "week", "month", "year", "all")
+    _WEATHER_UNITS = ("metric", "imperial", "standard")
+    _FILTER_RES = ("All", "1920x1080+", "2560x1440+", "3440x1440+", "3840x2160+")
+    _SORT_BY = ("Newest First", "Oldest First", "Highest Resolution", "Lowest Resolution")
+
+    _LOG_TAIL_BYTES = 256 * 1024
+    _LOG_MAX_LINES = 5000
+    _WEATHER_TEST_TTL = 60
+    # Gallery card footprint: 250px card + 20px padding
+    _GALLERY_CARD_WIDTH = 270
+    # Size of a card before its contents are built; close to a filled card so scrolling stays stable
+    _CARD_PLACEHOLDER_SIZE = (334, 310)
+    # Seconds a monitor enumeration is reused before asking Windows again
+    _MONITORS_TTL = 5.0
+    # Weather control variables: (attribute, variable class, settings key, default, coerce)
+    _WEATHER_VAR_SPEC = (
+        ("weather_enabled_var", tk.BooleanVar, "enabled", False, bool),
+        ("weather_provider_var", tk.StringVar, "provider", "openweathermap", str),
+        ("weather_refresh_var", tk.IntVar, "refresh_minutes", 30, int),
+        ("weather_units_var", tk.StringVar, "units", "metric", str),
+    )
+    _WEATHER_LOCATION_VAR_SPEC = (
+        ("weather_city_var", tk.StringVar, "city", "", str),
+        ("weather_country_var", tk.StringVar, "country", "", str),
+        ("weather_lat_var", tk.StringVar, "latitude", "", str),
+        ("weather_lon_var", tk.StringVar, "longitude", "", str),
+    )
+    _TRIGGERS = ("startup", "scheduler", "hotkey", "tray", "gui")
+    # Scheduler weekdays; bit i of the active-days mask is _DAYS[i]
+    _DAYS = (("Mon", "mon"), ("Tue", "tue"), ("Wed", "wed"), ("Thu", "thu"),
+             ("Fri", "fri"), ("Sat", "sat"), ("Sun", "sun"))
+
     def __init__(self, root: tk.Tk) -> None:
         self.root = root
         self.root.title("Wallpaper Changer")
@@ -51,15 +396,42 @@ class WallpaperConfigGUI:
         except:
             pass
 
+        # Named fonts shared by the help and logs tabs
+        self._fn_body = tkfont.Font(family='Segoe UI', size=9)
+        self._fn_button = tkfont.Font(family='Segoe UI', size=9, weight='bold')
+        self._fn_bold = tkfont.Font(family='Segoe UI', size=11, weight='bold')
+        self._fn_section = tkfont.Font(family='Segoe UI', size=12, weight='bold')
+        self._fn_title = tkfont.Font(family='Segoe UI', size=14, weight='bold')
+        self._fn_code = tkfont.Font(family='Consolas', size=9)
+
         # Configure modern theme
         self._setup_theme()
 
+        # Canvases scrolled by the root-level mouse wheel dispatcher
+        self._scrollable_canvases: set = set()
+        self.root.bind_all("<MouseWheel>", self._on_global_wheel)
+
+        # Widgets that later helpers may need, registered once the tab building them has run
+        self._widgets: Dict[str, tk.Widget] = {}
+
+        # Successful weather test results: settings tuple -> (monotonic time, status text)
+        self._weather_test_cache: Dict[tuple, Tuple[float, str]] = {}
+        # Pooled HTTP session so repeated weather tests reuse the TLS connection
+        self._http = requests.Session()
+
+        # Editor text from _format_python_literal, keyed by repr() of the value
+        self._literal_format_cache: Dict[str, str] = {}
+
         base_path = Path(__file__).parent
         self.config_path = base_path / "config.py"
         self.provider_state_path = base_path / "provider_state.json"
         self.gui_signal_path = base_path / "gui_restore.signal"
         self.gui_pid_path = base_path / "gui_config.pid"
         self.config_data: Dict[str, Any] = {}
+        # Last config.py text read or written: ((st_mtime_ns, st_size), text)
+        self._config_text: Optional[Tuple[Tuple[int, int], str]] = None
+        self._config_write_lock = threading.Lock()  # Serializes background saves
+        self._config_loaded_stamp: Optional[Tuple[int, int]] = None  # File stamp config_data was parsed from
 
         # Write GUI PID file
         self._write_gui_pid()
@@ -73,8 +445,20 @@ class WallpaperConfigGUI:
             enable_rotation=bool(CacheSettings.get("enable_offline_rotation", True)),
         )
 
-        # Thumbnail cache to avoid reloading images
-        self.thumbnail_cache = {}
+        # Thumbnail cache to avoid reloading images, keyed by (path, mtime_ns); kept across refreshes
+        self.thumbnail_cache: Dict[Tuple[str, Optional[int]], Tuple[Any, Tuple[int, int]]] = {}
+        # Thumbnails decode on a worker pool; cards waiting for an image path are listed here
+        self._thumb_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+        self._thumb_waiters: Dict[str, List[Tuple[tk.Label, tk.Label]]] = {}
+        self._thumb_placeholder = None
+        self._thumb_cards: List[tk.Frame] = []  # Cards for cached_entries, reflowed on resize
+        self._last_cols = 0  # Gallery column count of the last layout
+        self._pending_cards: List[Tuple[tk.Frame, Dict[str, Any]]] = []  # Cards not yet scrolled into view
+        self._cached_files: Dict[str, int] = {}  # Cache folder file path -> mtime_ns at the last refresh
+        self._resolution_cache: Dict[Tuple[str, Optional[int]], Tuple[int, int]] = {}  # Sizes read from image headers
+        self._shown_entries_key: Optional[Tuple] = None  # Index identity and folder listing of the last render
+        # Resized thumbnails persisted across runs, keyed by source path, mtime and size
+        self._thumb_dir = Path(self.cache_manager.cache_dir) / ".thumbs"
 
         # Filter and sort state
         self.filter_resolution = tk.StringVar(value="All")
@@ -84,6 +468,20 @@ class WallpaperConfigGUI:
 
         self.playlists_data: List[Dict[str, Any]] = list(self.config_data.get("Playlists") or [])
         self.weather_settings: Dict[str, Any] = dict(self.config_data.get("WeatherRotationSettings") or {})
+        # Unique playlist names and the summary label text, recomputed whenever playlists_data changes
+        self._playlist_names: List[str] = []
+        self._cached_playlist_summary = ""
+        self._update_playlist_names()
+
+        # Shared IDesktopWallpaper controller, reused for the app lifetime
+        self._wallpaper_ctl = None
+        self._monitors_cache: List[Dict[str, Any]] = []
+        self._monitors_ts = float("-inf")
+        self._monitors_from_controller = False  # False when the cache holds the user32 fallback
+        try:
+            self._get_wallpaper_controller()
+        except Exception:
+            pass  # Not available; monitor lookups fall back to user32
 
         # Check and start main app if not running
         self._ensure_main_app_running()
@@ -161,6 +559,42 @@ class WallpaperConfigGUI:
             font=('Segoe UI', 10),
             foreground=self.COLORS['text_secondary'])
 
+        style.configure('Head.TLabel',
+            font=('Segoe UI', 9, 'bold'))
+
+        style.configure('Gray.TLabel',
+            foreground='gray')
+
+        style.configure('Hint.TLabel',
+            foreground='gray',
+            font=('Segoe UI', 8))
+
+        style.configure('Muted.TLabel',
+            foreground=self.COLORS['text_muted'],
+            font=('Segoe UI', 8))
+
+        style.configure('Secondary.TLabel',
+            foreground=self.COLORS['text_secondary'])
+
+        # Help tab labels
+        style.configure('Help.Title.TLabel',
+            background=self.COLORS['bg_secondary'],
+            foreground=self.COLORS['accent'],
+            font=('Segoe UI', 16, 'bold'))
+
+        style.configure('Help.Subtitle.TLabel',
+            background=self.COLORS['bg_secondary'],
+            foreground=self.COLORS['text_secondary'],
+            font=('Segoe UI', 10))
+
+        style.configure('Help.Treeview',
+            background=self.COLORS['bg_secondary'],
+            fieldbackground=self.COLORS['bg_secondary'],
+            foreground=self.COLORS['text_primary'],
+            font=self._fn_body,
+            rowheight=22,
+            borderwidth=0)
+
         # Configure Buttons
         style.configure('TButton',
             background=self.COLORS['accent'],
@@ -245,18 +679,39 @@ class WallpaperConfigGUI:
         self.root.option_add('*TCombobox*Listbox.selectForeground', '#1e1e2e')
 
     def _bind_mousewheel(self, widget) -> None:
-        """Bind mouse wheel scrolling to canvas"""
-        def on_mousewheel(event):
-            widget.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        """Register a canvas with the root-level mouse wheel dispatcher"""
+        self._scrollable_canvases.add(widget)
+
+    def _on_global_wheel(self, event) -> None:
+        """Scroll the registered canvas under the pointer"""
+        try:
+            widget = self.root.winfo_containing(event.x_root, event.y_root)
+            while widget is not None:
+                if widget in self._scrollable_canvases:
+                    widget.yview_scroll(int(-1 * (event.delta / 120)), "units")
+                    return
+                parent_name = widget.winfo_parent()
+                if not parent_name:
+                    return
+                widget = widget.nametowidget(parent_name)
+        except (KeyError, tk.TclError):
+            # Pointer is over a Tk-internal widget (e.g. combobox popdown)
+            pass
+
+    def _bind_scrollregion(self, frame, canvas) -> None:
+        """Update canvas scrollregion once a burst of frame <Configure> events settles"""
+        pending = [None]
 
-        def on_enter(event):
-            widget.bind_all("<MouseWheel>", on_mousewheel)
+        def update_region() -> None:
+            pending[0] = None
+            canvas.configure(scrollregion=canvas.bbox("all"))
 
-        def on_leave(event):
-            widget.unbind_all("<MouseWheel>")
+        def on_configure(event) -> None:
+            if pending[0] is not None:
+                canvas.after_cancel(pending[0])
+            pending[0] = canvas.after(50, update_region)
 
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
+        frame.bind("<Configure>", on_configure)
 
     def _ensure_main_app_running(self) -> None:
         """Ensure the main wallpaper app is running, start it if not"""
@@ -553,11 +1008,57 @@ class WallpaperConfigGUI:
         # Start monitoring
         check_restore_signal()
 
+    def _get_wallpaper_controller(self):
+        """Return the shared DesktopWallpaperController, creating it on first use"""
+        if self._wallpaper_ctl is None:
+            from main import DesktopWallpaperController
+            self._wallpaper_ctl = DesktopWallpaperController()
+        return self._wallpaper_ctl
+
+    def _get_monitors(self, max_age: float = None) -> List[Dict[str, Any]]:
+        """Enumerate monitors, reusing the last result for up to _MONITORS_TTL seconds"""
+        if max_age is None:
+            max_age = self._MONITORS_TTL
+        now = time.monotonic()
+        if now - self._monitors_ts < max_age:
+            return self._monitors_cache
+
+        from main import enumerate_monitors_user32
+
+        monitors = []
+        from_controller = False
+        try:
+            monitors = self._get_wallpaper_controller().enumerate_monitors()
+            from_controller = True
+        except Exception:
+            self._close_wallpaper_controller()
+            try:
+                monitors = enumerate_monitors_user32()
+            except Exception:
+                pass
+
+        self._monitors_cache, self._monitors_ts = monitors, now
+        self._monitors_from_controller = from_controller
+        return monitors
+
+    def _close_wallpaper_controller(self) -> None:
+        """Release the shared DesktopWallpaperController"""
+        if self._wallpaper_ctl is not None:
+            try:
+                self._wallpaper_ctl.close()
+            except Exception:
+                pass
+            self._wallpaper_ctl = None
+
     def _quit_application(self) -> None:
         """Quit the GUI application completely - stop service if we started it"""
         # Remove GUI PID file
         self._remove_gui_pid()
 
+        self._close_wallpaper_controller()
+        self._http.close()
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
+
         if hasattr(self, 'service_started_by_gui') and self.service_started_by_gui:
             # We started the service, so stop it when quitting
             try:
@@ -588,10 +1089,13 @@ class WallpaperConfigGUI:
         self.root.destroy()
 
     def _load_config(self) -> None:
-        """Load current configuration from config.py"""
+        """Load current configuration from config.py; a no-op while the file is unchanged"""
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            stat = self.config_path.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stamp == self._config_loaded_stamp:
+                return
+            content = self._read_config_text()
 
             # Import config module directly to handle os.getenv() and other dynamic values
             import importlib.util
@@ -607,132 +1111,56 @@ class WallpaperConfigGUI:
                 weather_settings = {}
                 playlists = []
 
-            # Parse basic settings (simplified parsing)
+            # Basic settings from a single parse of the file
+            parsed = _parse_config_literals(content)
+            scheduler = parsed.get("SchedulerSettings")
+            scheduler = scheduler if isinstance(scheduler, dict) else {}
+            cache = parsed.get("CacheSettings")
+            cache = cache if isinstance(cache, dict) else {}
+            reddit = parsed.get("RedditSettings")
+            monitors = parsed.get("Monitors")
             self.config_data = {
-                "Provider": self._extract_value(content, "Provider"),
-                "ProvidersSequence": self._extract_list(content, "ProvidersSequence"),
-                "RotateProviders": self._extract_value(content, "RotateProviders") == "True",
-                "Query": self._extract_value(content, "Query"),
-                "PurityLevel": self._extract_value(content, "PurityLevel"),
-                "ScreenResolution": self._extract_value(content, "ScreenResolution"),
-                "WallhavenSorting": self._extract_value(content, "WallhavenSorting"),
-                "WallhavenTopRange": self._extract_value(content, "WallhavenTopRange"),
-                "PexelsMode": self._extract_value(content, "PexelsMode"),
-                "KeyBind": self._extract_value(content, "KeyBind"),
-                "SchedulerEnabled": self._extract_dict_value(content, "SchedulerSettings", "enabled"),
-                "SchedulerInterval": self._extract_dict_value(content, "SchedulerSettings", "interval_minutes"),
-                "SchedulerJitter": self._extract_dict_value(content, "SchedulerSettings", "jitter_minutes"),
-                "CacheMaxItems": self._extract_dict_value(content, "CacheSettings", "max_items"),
-                "CacheOfflineRotation": self._extract_dict_value(content, "CacheSettings", "enable_offline_rotation"),
-                "RedditSettings": self._extract_dict_literal(content, "RedditSettings"),
-                "Monitors": self._extract_monitors(content),
-                "DefaultPlaylist": self._extract_value(content, "DefaultPlaylist"),
+                "Provider": parsed.get("Provider", ""),
+                "ProvidersSequence": list(parsed.get("ProvidersSequence") or []),
+                "RotateProviders": parsed.get("RotateProviders") is True,
+                "Query": parsed.get("Query", ""),
+                "PurityLevel": parsed.get("PurityLevel", ""),
+                "ScreenResolution": parsed.get("ScreenResolution", ""),
+                "WallhavenSorting": parsed.get("WallhavenSorting", ""),
+                "WallhavenTopRange": parsed.get("WallhavenTopRange", ""),
+                "PexelsMode": parsed.get("PexelsMode", ""),
+                "KeyBind": parsed.get("KeyBind", ""),
+                "SchedulerEnabled": scheduler.get("enabled"),
+                "SchedulerInterval": scheduler.get("interval_minutes"),
+                "SchedulerJitter": scheduler.get("jitter_minutes"),
+                "SchedulerInitialDelay": scheduler.get("initial_delay_minutes"),
+                "CacheMaxItems": cache.get("max_items"),
+                "CacheOfflineRotation": cache.get("enable_offline_rotation"),
+                "RedditSettings": reddit if isinstance(reddit, dict) else {},
+                "Monitors": [m for m in monitors if isinstance(m, dict)] if isinstance(monitors, list) else [],
+                "DefaultPreset": parsed.get("DefaultPreset", ""),
+                "DefaultPlaylist": parsed.get("DefaultPlaylist", ""),
                 "Playlists": playlists,
                 "WeatherRotationSettings": weather_settings,
             }
+            self._config_loaded_stamp = stamp
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load config: {e}")
 
-    def _extract_value(self, content: str, key: str) -> str:
-        """Extract simple value from config content"""
-        for line in content.split("\n"):
-            if line.strip().startswith(f"{key} ="):
-                value = line.split("=", 1)[1].strip()
-                return value.strip('"\'')
-        return ""
-
-    def _extract_list(self, content: str, key: str) -> List[str]:
-        """Extract list value from config content"""
-        for line in content.split("\n"):
-            if line.strip().startswith(f"{key} ="):
-                value = line.split("=", 1)[1].strip()
-                # Simple list parsing
-                value = value.strip("[]").replace('"', '').replace("'", "")
-                return [item.strip() for item in value.split(",") if item.strip()]
-        return []
-
-    def _extract_dict_value(self, content: str, dict_name: str, key: str) -> Any:
-        """Extract value from dictionary in config"""
-        in_dict = False
-        for line in content.split("\n"):
-            if f"{dict_name} = {{" in line or f"{dict_name} ={{" in line:
-                in_dict = True
-                continue
-            if in_dict:
-                if "}" in line and not line.strip().startswith('"'):
-                    break
-                if f'"{key}":' in line or f"'{key}':" in line:
-                    value = line.split(":", 1)[1].strip().rstrip(",")
-                    if value in ("True", "False"):
-                        return value == "True"
-                    try:
-                        return int(value)
-                    except ValueError:
-                        return value.strip('"\'')
-        return None
-
-    def _extract_monitors(self, content: str) -> List[Dict]:
-        """Extract Monitors list from config"""
-        try:
-            import re
-            # Find the Monitors section
-            monitors_match = re.search(r'Monitors\s*=\s*\[(.*?)\]', content, re.DOTALL)
-            if not monitors_match:
-                return []
-
-            monitors_str = monitors_match.group(1)
-            monitors = []
-
-            # Split by dictionary entries
-            dict_pattern = r'\{([^}]+)\}'
-            for dict_match in re.finditer(dict_pattern, monitors_str):
-                dict_content = dict_match.group(1)
-                monitor = {}
-
-                # Extract key-value pairs
-                for line in dict_content.split('\n'):
-                    if ':' in line:
-                        key_val = line.split(':', 1)
-                        if len(key_val) == 2:
-                            key = key_val[0].strip().strip('"\'')
-                            val = key_val[1].strip().rstrip(',').strip('"\'')
-                            monitor[key] = val
-
-                if monitor:
-                    monitors.append(monitor)
-
-            return monitors
-        except Exception as e:
-            print(f"Error extracting monitors: {e}")
-            return []
-
-    def _extract_literal(self, content: str, name: str, default: Optional[Any] = None) -> Optional[Any]:
-        """Extract a Python literal assigned to the given name using AST parsing."""
-        try:
-            module = ast.parse(content)
-            for node in module.body:
-                if isinstance(node, ast.Assign):
-                    for target in node.targets:
-                        if isinstance(target, ast.Name) and target.id == name:
-                            return ast.literal_eval(node.value)
-        except Exception as error:
-            print(f"Unable to extract literal for {name}: {error}")
-        return default
-
-    def _extract_dict_literal(self, content: str, key: str) -> Dict[str, Any]:
-        """Extract dictionary literal assigned to key using AST parsing."""
-        try:
-            tree = ast.parse(content)
-            for node in tree.body:
-                if isinstance(node, ast.Assign):
-                    for target in node.targets:
-                        if isinstance(target, ast.Name) and target.id == key:
-                            value = ast.literal_eval(node.value)
-                            if isinstance(value, dict):
-                                return value
-        except Exception as exc:
-            print(f"Error extracting {key}: {exc}")
-        return {}
+    def _read_config_text(self) -> str:
+        """Return config.py text, reusing the last read or write while the file is unchanged"""
+        stat = self.config_path.stat()
+        if self._config_text is not None and self._config_text[0] == (stat.st_mtime_ns, stat.st_size):
+            return self._config_text[1]
+        with open(self.config_path, "r", encoding="utf-8") as f:
+            text = f.read()
+        self._config_text = ((stat.st_mtime_ns, stat.st_size), text)
+        return text
+
+    def _remember_config_text(self, text: str) -> None:
+        """Record text just written to config.py so the next read can skip the disk"""
+        stat = self.config_path.stat()
+        self._config_text = ((stat.st_mtime_ns, stat.st_size), text)
 
     def _create_widgets(self) -> None:
         """Create GUI widgets"""
@@ -795,16 +1223,17 @@ class WallpaperConfigGUI:
         self.notebook.add(self.advanced_frame, text="Advanced")
         self._create_advanced_tab()
 
-        # Tab 4: Help & Features
+        # Tab 4: Help & Features (built on first visit)
         self.help_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.help_frame, text="Help & Features")
-        self._create_help_tab()
 
-        # Tab 5: Logs
+        # Tab 5: Logs (log file loaded on first visit)
         self.logs_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.logs_frame, text="Logs")
         self._create_logs_tab()
 
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
         # Bottom buttons
         button_frame = ttk.Frame(self.root)
         button_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -817,6 +1246,21 @@ class WallpaperConfigGUI:
         # Handle window close button (X)
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
 
+    def _on_tab_changed(self, event=None) -> None:
+        """Build deferred tab content the first time a tab is shown"""
+        selected = self.notebook.select()
+        if selected == str(self.help_frame):
+            self._create_help_tab()
+        if selected != str(self.logs_frame):
+            # No log polling while the Logs tab is hidden
+            self._cancel_auto_refresh()
+        elif self.auto_refresh_var.get():
+            self._logs_loaded = True
+            self._auto_refresh_logs()
+        elif not self._logs_loaded:
+            self._logs_loaded = True
+            self._refresh_logs()
+
     def _create_settings_tab(self) -> None:
         """Create settings tab content"""
         # Create canvas with scrollbar
@@ -825,10 +1269,7 @@ class WallpaperConfigGUI:
         scrollbar = ttk.Scrollbar(self.settings_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self._bind_scrollregion(scrollable_frame, canvas)
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -846,7 +1287,7 @@ class WallpaperConfigGUI:
         ttk.Label(provider_group, text="Default Provider:").grid(row=0, column=0, sticky=tk.W, pady=2)
         self.provider_var = tk.StringVar(value=self.config_data.get("Provider", "wallhaven"))
         ttk.Combobox(provider_group, textvariable=self.provider_var,
-                     values=["wallhaven", "pexels", "reddit"], width=30).grid(row=0, column=1, pady=2)
+                     values=self._PROVIDERS, width=30).grid(row=0, column=1, pady=2)
 
         ttk.Label(provider_group, text="Search Query:").grid(row=1, column=0, sticky=tk.W, pady=2)
         self.query_var = tk.StringVar(value=self.config_data.get("Query", "nature"))
@@ -883,24 +1324,24 @@ class WallpaperConfigGUI:
         ttk.Label(wallhaven_group, text="Purity Level:").grid(row=0, column=0, sticky=tk.W, pady=2)
         self.purity_var = tk.StringVar(value=self.config_data.get("PurityLevel", "100"))
         ttk.Combobox(wallhaven_group, textvariable=self.purity_var,
-                     values=["100", "110", "111", "010", "001"], width=30).grid(row=0, column=1, pady=2)
+                     values=self._PURITY_CHOICES, width=30).grid(row=0, column=1, pady=2)
         ttk.Label(wallhaven_group, text="(100=SFW, 110=SFW+Sketchy, 111=All)").grid(row=0, column=2, sticky=tk.W, padx=5)
 
         ttk.Label(wallhaven_group, text="Min Resolution:").grid(row=1, column=0, sticky=tk.W, pady=2)
         self.resolution_var = tk.StringVar(value=self.config_data.get("ScreenResolution", "1920x1080"))
         ttk.Combobox(wallhaven_group, textvariable=self.resolution_var,
-                     values=["1920x1080", "2560x1440", "3440x1440", "3840x2160"],
+                     values=self._RESOLUTIONS,
                      width=30).grid(row=1, column=1, pady=2)
 
         ttk.Label(wallhaven_group, text="Sorting:").grid(row=2, column=0, sticky=tk.W, pady=2)
         self.sorting_var = tk.StringVar(value=self.config_data.get("WallhavenSorting", "toplist"))
         ttk.Combobox(wallhaven_group, textvariable=self.sorting_var,
-                     values=["random", "toplist", "favorites", "views"], width=30).grid(row=2, column=1, pady=2)
+                     values=self._SORT_OPTIONS, width=30).grid(row=2, column=1, pady=2)
 
         ttk.Label(wallhaven_group, text="Top Range:").grid(row=3, column=0, sticky=tk.W, pady=2)
         self.toprange_var = tk.StringVar(value=self.config_data.get("WallhavenTopRange", "1M"))
         ttk.Combobox(wallhaven_group, textvariable=self.toprange_var,
-                     values=["1d", "3d", "1w", "1M", "3M", "6M", "1y"], width=30).grid(row=3, column=1, pady=2)
+                     values=self._TOP_RANGES, width=30).grid(row=3, column=1, pady=2)
 
         # Pexels Settings
         pexels_group = ttk.LabelFrame(scrollable_frame, text="Pexels Settings", padding=10)
@@ -909,7 +1350,7 @@ class WallpaperConfigGUI:
         ttk.Label(pexels_group, text="Mode:").grid(row=0, column=0, sticky=tk.W, pady=2)
         self.pexels_mode_var = tk.StringVar(value=self.config_data.get("PexelsMode", "curated"))
         ttk.Combobox(pexels_group, textvariable=self.pexels_mode_var,
-                     values=["search", "curated"], width=30).grid(row=0, column=1, pady=2)
+                     values=self._PEXELS_MODES, width=30).grid(row=0, column=1, pady=2)
 
         # Reddit Settings
         reddit_group = ttk.LabelFrame(scrollable_frame, text="Reddit Settings", padding=10)
@@ -921,12 +1362,12 @@ class WallpaperConfigGUI:
 
         ttk.Label(reddit_group, text="Sort:").grid(row=1, column=0, sticky=tk.W, pady=2)
         ttk.Combobox(reddit_group, textvariable=self.reddit_sort_var,
-                     values=["hot", "new", "rising", "top", "controversial"],
+                     values=self._REDDIT_SORTS,
                      width=30, state="readonly").grid(row=1, column=1, pady=2)
 
         ttk.Label(reddit_group, text="Time Filter:").grid(row=2, column=0, sticky=tk.W, pady=2)
         ttk.Combobox(reddit_group, textvariable=self.reddit_time_var,
-                     values=["hour", "day", "week", "month", "year", "all"],
+                     values=self._TIME_FILTERS,
                      width=30, state="readonly").grid(row=2, column=1, pady=2)
         ttk.Label(reddit_group, text="(Used for Top/Controversial)").grid(row=2, column=2, sticky=tk.W, padx=5)
 
@@ -945,7 +1386,7 @@ class WallpaperConfigGUI:
 
         ttk.Label(reddit_group,
                   text="Reddit requires a descriptive user-agent; consider using your Reddit username.",
-                  foreground="gray").grid(row=7, column=0, columnspan=3, sticky=tk.W, pady=(2, 0))
+                  style='Gray.TLabel').grid(row=7, column=0, columnspan=3, sticky=tk.W, pady=(2, 0))
 
         # Scheduler Settings
         scheduler_group = ttk.LabelFrame(scrollable_frame, text="Scheduler Settings", padding=10)
@@ -980,26 +1421,15 @@ class WallpaperConfigGUI:
         monitors_group.pack(fill=tk.X, padx=10, pady=5)
 
         # Detect active monitors
-        from main import enumerate_monitors_user32, DesktopWallpaperController
-
-        monitors = []
-        try:
-            manager = DesktopWallpaperController()
-            monitors = manager.enumerate_monitors()
-            manager.close()
-        except Exception:
-            try:
-                monitors = enumerate_monitors_user32()
-            except Exception:
-                pass
+        monitors = self._get_monitors()
 
         if not monitors:
             ttk.Label(monitors_group, text="No monitors detected. Connect monitors and restart the app.",
-                     foreground="gray").grid(row=0, column=0, columnspan=3, pady=5)
+                     style='Gray.TLabel').grid(row=0, column=0, columnspan=3, pady=5)
         else:
             ttk.Label(monitors_group,
                      text="Set minimum resolution for each active monitor:",
-                     font=('Segoe UI', 9, 'bold')).grid(row=0, column=0, columnspan=3, sticky=tk.W, pady=(0, 10))
+                     style='Head.TLabel').grid(row=0, column=0, columnspan=3, sticky=tk.W, pady=(0, 10))
 
             self.monitor_resolution_vars = {}
 
@@ -1024,15 +1454,14 @@ class WallpaperConfigGUI:
                 self.monitor_resolution_vars[idx] = res_var
 
                 res_combo = ttk.Combobox(monitors_group, textvariable=res_var,
-                                        values=["1920x1080", "2560x1440", "3440x1440", "3840x2160", "5120x1440", current_res],
+                                        values=self._MONITOR_RESOLUTIONS + (current_res,),
                                         width=20)
                 res_combo.grid(row=idx+1, column=1, pady=3, padx=5)
 
                 # Info label
                 ttk.Label(monitors_group,
                          text="(Min resolution for wallpapers)",
-                         foreground="gray",
-                         font=('Segoe UI', 8)).grid(row=idx+1, column=2, sticky=tk.W, pady=3, padx=5)
+                         style='Hint.TLabel').grid(row=idx+1, column=2, sticky=tk.W, pady=3, padx=5)
 
         # Hotkey Settings
         hotkey_group = ttk.LabelFrame(scrollable_frame, text="Hotkey Settings", padding=10)
@@ -1122,14 +1551,14 @@ class WallpaperConfigGUI:
 
         ttk.Label(control_frame1, text="Filter by Resolution:").pack(side=tk.LEFT, padx=5)
         filter_combo = ttk.Combobox(control_frame1, textvariable=self.filter_resolution,
-                                    values=["All", "1920x1080+", "2560x1440+", "3440x1440+", "3840x2160+"],
+                                    values=self._FILTER_RES,
                                     width=15, state="readonly")
         filter_combo.pack(side=tk.LEFT, padx=5)
         filter_combo.bind("<<ComboboxSelected>>", lambda e: self._apply_filters())
 
         ttk.Label(control_frame1, text="Sort by:").pack(side=tk.LEFT, padx=(15, 5))
         sort_combo = ttk.Combobox(control_frame1, textvariable=self.sort_by,
-                                  values=["Newest First", "Oldest First", "Highest Resolution", "Lowest Resolution"],
+                                  values=self._SORT_BY,
                                   width=18, state="readonly")
         sort_combo.pack(side=tk.LEFT, padx=5)
         sort_combo.bind("<<ComboboxSelected>>", lambda e: self._apply_filters())
@@ -1146,6 +1575,11 @@ class WallpaperConfigGUI:
         ttk.Button(control_frame2, text="Refresh Gallery", command=self._refresh_gallery).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame2, text="Clear Cache", command=self._clear_cache).pack(side=tk.LEFT, padx=5)
 
+        # Inline result of the last apply, cleared after a couple of seconds
+        self.gallery_status_label = ttk.Label(control_frame2, text="")
+        self.gallery_status_label.pack(side=tk.LEFT, padx=10)
+        self._gallery_status_after_id = None
+
         # Create canvas with scrollbar for gallery
         gallery_container = ttk.Frame(self.cache_frame)
         gallery_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
@@ -1155,13 +1589,11 @@ class WallpaperConfigGUI:
         gallery_scrollbar = ttk.Scrollbar(gallery_container, orient="vertical", command=self.gallery_canvas.yview)
         self.gallery_frame = ttk.Frame(self.gallery_canvas)
 
-        self.gallery_frame.bind(
-            "<Configure>",
-            lambda e: self.gallery_canvas.configure(scrollregion=self.gallery_canvas.bbox("all"))
-        )
+        self._bind_scrollregion(self.gallery_frame, self.gallery_canvas)
 
-        self.gallery_canvas.create_window((0, 0), window=self.gallery_frame, anchor="nw")
-        self.gallery_canvas.configure(yscrollcommand=gallery_scrollbar.set)
+        self._gallery_window = self.gallery_canvas.create_window((0, 0), window=self.gallery_frame, anchor="nw")
+        self._gallery_scrollbar = gallery_scrollbar
+        self.gallery_canvas.configure(yscrollcommand=self._on_gallery_yscroll)
 
         self.gallery_canvas.pack(side="left", fill="both", expand=True)
         gallery_scrollbar.pack(side="right", fill="y")
@@ -1175,8 +1607,13 @@ class WallpaperConfigGUI:
         # Load monitors
         self._load_monitors()
 
-        # Load gallery
-        self._refresh_gallery()
+        # Load gallery in the background so the window shows immediately. The worker only
+        # fills a queue: calling Tk from it before mainloop() starts would raise RuntimeError.
+        ttk.Label(self.gallery_frame, text="Loading wallpapers...",
+                 font=("Arial", 10)).pack(pady=20, padx=20)
+        scan_results: queue.Queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._scan_cache_entries, args=(scan_results,), daemon=True).start()
+        self.root.after(50, self._poll_gallery_scan, scan_results)
 
     def _create_advanced_tab(self) -> None:
         """Create advanced parameters tab content"""
@@ -1186,10 +1623,7 @@ class WallpaperConfigGUI:
         scrollbar = ttk.Scrollbar(self.advanced_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self._bind_scrollregion(scrollable_frame, canvas)
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -1206,19 +1640,13 @@ class WallpaperConfigGUI:
 
         # Load current API keys from .env
         env_path = Path(__file__).parent / '.env'
-        current_wallhaven_key = ""
-        current_pexels_key = ""
-        current_openweather_key = ""
-
+        env: Dict[str, str] = {}
         if env_path.exists():
-            with open(env_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.startswith('WALLHAVEN_API_KEY='):
-                        current_wallhaven_key = line.split('=', 1)[1].strip()
-                    elif line.startswith('PEXELS_API_KEY='):
-                        current_pexels_key = line.split('=', 1)[1].strip()
-                    elif line.startswith('OPENWEATHER_API_KEY='):
-                        current_openweather_key = line.split('=', 1)[1].strip()
+            env_text = env_path.read_text(encoding='utf-8')
+            env = {key: value.strip() for key, value in _ENV_RE.findall(env_text)}
+        current_wallhaven_key = env.get('WALLHAVEN_API_KEY', '')
+        current_pexels_key = env.get('PEXELS_API_KEY', '')
+        current_openweather_key = env.get('OPENWEATHER_API_KEY', '')
 
         ttk.Label(api_group, text="Wallhaven API Key:").grid(row=0, column=0, sticky=tk.W, pady=5, padx=5)
         self.wallhaven_key_var = tk.StringVar(value=current_wallhaven_key)
@@ -1243,7 +1671,7 @@ class WallpaperConfigGUI:
 
         # Info label for OpenWeather
         ttk.Label(api_group, text="🌤️ Free tier: 1000 calls/day · Get it at: https://home.openweathermap.org/api_keys",
-                 foreground=self.COLORS['text_muted'], font=('Segoe UI', 8)).grid(row=3, column=0, columnspan=3, sticky=tk.W, padx=5, pady=(0, 5))
+                 style='Muted.TLabel').grid(row=3, column=0, columnspan=3, sticky=tk.W, padx=5, pady=(0, 5))
 
         ttk.Button(api_group, text="💾 Save API Keys", command=self._save_api_keys).grid(row=4, column=1, pady=10, sticky=tk.E)
 
@@ -1266,8 +1694,7 @@ class WallpaperConfigGUI:
         scheduler_group.pack(fill=tk.X, padx=10, pady=5)
 
         ttk.Label(scheduler_group, text="Initial Delay (minutes):").grid(row=0, column=0, sticky=tk.W, pady=5, padx=5)
-        self.initial_delay_var = tk.IntVar(value=self._extract_dict_value(self._get_config_content(),
-                                                                           "SchedulerSettings", "initial_delay_minutes") or 1)
+        self.initial_delay_var = tk.IntVar(value=self.config_data.get("SchedulerInitialDelay") or 1)
         ttk.Spinbox(scheduler_group, from_=0, to=60, textvariable=self.initial_delay_var, width=15).grid(row=0, column=1, pady=5, padx=5, sticky=tk.W)
 
         ttk.Label(scheduler_group, text="Quiet Hours:").grid(row=1, column=0, sticky=tk.W, pady=5, padx=5)
@@ -1286,13 +1713,13 @@ class WallpaperConfigGUI:
         days_frame = ttk.Frame(scheduler_group)
         days_frame.grid(row=2, column=1, columnspan=2, pady=5, sticky=tk.W)
 
-        self.days_vars = {}
-        days = [("Mon", "mon"), ("Tue", "tue"), ("Wed", "wed"), ("Thu", "thu"),
-                ("Fri", "fri"), ("Sat", "sat"), ("Sun", "sun")]
-        for idx, (label, value) in enumerate(days):
-            var = tk.BooleanVar(value=True)
-            self.days_vars[value] = var
-            ttk.Checkbutton(days_frame, text=label, variable=var).grid(row=0, column=idx, padx=2)
+        # One bit per weekday instead of a BooleanVar per checkbutton
+        self._days_mask = tk.IntVar(value=0x7F)
+        for idx, (label, _value) in enumerate(self._DAYS):
+            day_cb = ttk.Checkbutton(days_frame, text=label)
+            day_cb.configure(command=lambda i=idx, cb=day_cb: self._toggle_day_bit(i, cb))
+            day_cb.state(['!alternate', 'selected' if self._days_mask.get() & (1 << idx) else '!selected'])
+            day_cb.grid(row=0, column=idx, padx=2)
 
         # Default Preset Section
         preset_group = ttk.LabelFrame(scrollable_frame, text="Default Preset", padding=10)
@@ -1304,7 +1731,7 @@ class WallpaperConfigGUI:
             from preset_manager import PresetManager
             preset_mgr = PresetManager()
             preset_names = [p.name for p in preset_mgr.list_presets()]
-            default_preset = self._extract_value(self._get_config_content(), "DefaultPreset") or "workspace"
+            default_preset = self.config_data.get("DefaultPreset") or "workspace"
         except:
             preset_names = ["workspace", "relax"]
             default_preset = "workspace"
@@ -1318,14 +1745,7 @@ class WallpaperConfigGUI:
         playlist_group.pack(fill=tk.X, padx=10, pady=5)
 
         raw_default_playlist = (self.config_data.get("DefaultPlaylist") or "").strip()
-        seen_playlist_names = set()
-        playlist_names: List[str] = []
-        for item in self.playlists_data:
-            if isinstance(item, dict):
-                name = str(item.get("name", "")).strip()
-                if name and name not in seen_playlist_names:
-                    playlist_names.append(name)
-                    seen_playlist_names.add(name)
+        playlist_names = self._playlist_names
         playlist_choices = ["(None)"] + playlist_names
         default_playlist_display = raw_default_playlist if raw_default_playlist in playlist_names else "(None)"
         self.default_playlist_display_var = tk.StringVar(value=default_playlist_display)
@@ -1340,16 +1760,11 @@ class WallpaperConfigGUI:
         )
         self.default_playlist_combo.grid(row=0, column=1, pady=5, padx=5, sticky=tk.W)
 
-        if playlist_names:
-            summary_lines = [f"- {name}" for name in playlist_names]
-            summary_text = "\n".join(summary_lines)
-        else:
-            summary_text = "No playlists defined yet."
         self.playlist_summary_label = ttk.Label(
             playlist_group,
-            text=summary_text,
+            text=self._cached_playlist_summary,
             justify=tk.LEFT,
-            foreground=self.COLORS['text_secondary'],
+            style='Secondary.TLabel',
         )
         self.playlist_summary_label.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=(0, 5), padx=5)
 
@@ -1360,61 +1775,52 @@ class WallpaperConfigGUI:
         ).grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=5, padx=5)
 
         # Weather Rotation Section
+        bg_tertiary = self.COLORS['bg_tertiary']
         weather_group = ttk.LabelFrame(scrollable_frame, text="Weather-Based Rotation", padding=10)
         weather_group.pack(fill=tk.X, padx=10, pady=5)
 
-        weather_location = self.weather_settings.get("location", {}) if isinstance(self.weather_settings, dict) else {}
         weather_apply_on = self.weather_settings.get("apply_on", []) if isinstance(self.weather_settings, dict) else []
 
-        self.weather_enabled_var = tk.BooleanVar(value=bool(self.weather_settings.get("enabled", False)))
-        self.weather_provider_var = tk.StringVar(value=str(self.weather_settings.get("provider", "openweathermap") or "openweathermap"))
+        for attr, var_cls, value in self._weather_var_values():
+            setattr(self, attr, var_cls(value=value))
         # weather_api_key_var already initialized in API Keys section above - use .env value if available, otherwise config
-        if not self.weather_api_key_var.get() and self.weather_settings.get("api_key"):
-            self.weather_api_key_var.set(str(self.weather_settings.get("api_key", "") or ""))
-        self.weather_refresh_var = tk.IntVar(value=int(self.weather_settings.get("refresh_minutes", 30) or 30))
-        self.weather_units_var = tk.StringVar(value=str(self.weather_settings.get("units", "metric") or "metric"))
-        self.weather_city_var = tk.StringVar(value=str(weather_location.get("city", "") or ""))
-        self.weather_country_var = tk.StringVar(value=str(weather_location.get("country", "") or ""))
-        self.weather_lat_var = tk.StringVar(value=str(weather_location.get("latitude", "") or ""))
-        self.weather_lon_var = tk.StringVar(value=str(weather_location.get("longitude", "") or ""))
+        config_api_key = self.weather_settings.get("api_key") if isinstance(self.weather_settings, dict) else None
+        if config_api_key and not self.weather_api_key_var.get():
+            self.weather_api_key_var.set(str(config_api_key))
 
         # Info banner at top
-        info_banner = tk.Frame(weather_group, bg=self.COLORS['bg_tertiary'], relief=tk.FLAT, pady=8, padx=10)
+        info_banner = tk.Frame(weather_group, bg=bg_tertiary, relief=tk.FLAT, pady=8, padx=10)
         info_banner.grid(row=0, column=0, columnspan=3, sticky=tk.EW, pady=(0, 10))
 
         tk.Label(info_banner,
                 text="🌤️ OpenWeatherMap è GRATUITO fino a 1000 chiamate/giorno (più che sufficiente!)",
-                bg=self.COLORS['bg_tertiary'],
+                bg=bg_tertiary,
                 fg=self.COLORS['success'],
                 font=('Segoe UI', 9, 'bold')).pack(anchor=tk.W)
 
         tk.Label(info_banner,
                 text="⏰ IMPORTANTE: Le nuove API key possono impiegare fino a 2 ore per attivarsi!",
-                bg=self.COLORS['bg_tertiary'],
+                bg=bg_tertiary,
                 fg=self.COLORS['warning'],
                 font=('Segoe UI', 8, 'bold')).pack(anchor=tk.W, pady=(3, 0))
 
         tk.Label(info_banner,
                 text="Ottieni la tua API key gratuita qui:",
-                bg=self.COLORS['bg_tertiary'],
+                bg=bg_tertiary,
                 fg=self.COLORS['text_secondary'],
                 font=('Segoe UI', 8)).pack(anchor=tk.W, pady=(3, 0))
 
-        link_frame = tk.Frame(info_banner, bg=self.COLORS['bg_tertiary'])
+        link_frame = tk.Frame(info_banner, bg=bg_tertiary)
         link_frame.pack(anchor=tk.W)
 
-        tk.Label(link_frame,
+        link_label = tk.Label(link_frame,
                 text="https://home.openweathermap.org/api_keys",
-                bg=self.COLORS['bg_tertiary'],
+                bg=bg_tertiary,
                 fg=self.COLORS['accent'],
                 font=('Segoe UI', 8, 'underline'),
-                cursor='hand2').pack(side=tk.LEFT)
-
-        def open_weather_link(event):
-            import webbrowser
-            webbrowser.open("https://home.openweathermap.org/api_keys")
-
-        link_frame.winfo_children()[0].bind("<Button-1>", open_weather_link)
+                cursor='hand2')
+        link_label.pack(side=tk.LEFT)
+        link_label.bind("<Button-1>", lambda e: webbrowser.open("https://home.openweathermap.org/api_keys"))
 
         ttk.Checkbutton(
             weather_group,
@@ -1461,14 +1867,19 @@ class WallpaperConfigGUI:
         ttk.Label(location_quick, text="Country:").pack(side=tk.LEFT, padx=(10, 2))
         ttk.Entry(location_quick, textvariable=self.weather_country_var, width=8).pack(side=tk.LEFT)
 
+        # Keystroke validators: digits only for minutes, signed decimals for coordinates
+        int_vcmd = (self.root.register(lambda text: _INT_RE.fullmatch(text) is not None), '%P')
+        num_vcmd = (self.root.register(lambda text: _NUM_RE.fullmatch(text) is not None), '%P')
+
         ttk.Label(weather_group, text="Refresh interval (minutes):").grid(row=5, column=0, sticky=tk.W, pady=5, padx=5)
-        ttk.Spinbox(weather_group, from_=5, to=180, increment=5, textvariable=self.weather_refresh_var, width=10).grid(row=5, column=1, pady=5, padx=5, sticky=tk.W)
+        ttk.Spinbox(weather_group, from_=5, to=180, increment=5, textvariable=self.weather_refresh_var, width=10,
+                    validate='key', validatecommand=int_vcmd).grid(row=5, column=1, pady=5, padx=5, sticky=tk.W)
 
         ttk.Label(weather_group, text="Units:").grid(row=6, column=0, sticky=tk.W, pady=5, padx=5)
         ttk.Combobox(
             weather_group,
             textvariable=self.weather_units_var,
-            values=["metric", "imperial", "standard"],
+            values=self._WEATHER_UNITS,
             state="readonly",
             width=15,
         ).grid(row=6, column=1, pady=5, padx=5, sticky=tk.W)
@@ -1478,37 +1889,28 @@ class WallpaperConfigGUI:
         advanced_loc = ttk.Frame(weather_group)
         advanced_loc.grid(row=7, column=1, columnspan=2, sticky=tk.W, pady=(10, 2), padx=5)
         ttk.Label(advanced_loc, text="Lat:").pack(side=tk.LEFT)
-        ttk.Entry(advanced_loc, textvariable=self.weather_lat_var, width=12).pack(side=tk.LEFT, padx=(2, 8))
+        ttk.Entry(advanced_loc, textvariable=self.weather_lat_var, width=12,
+                  validate='key', validatecommand=num_vcmd).pack(side=tk.LEFT, padx=(2, 8))
         ttk.Label(advanced_loc, text="Lon:").pack(side=tk.LEFT)
-        ttk.Entry(advanced_loc, textvariable=self.weather_lon_var, width=12).pack(side=tk.LEFT, padx=2)
+        ttk.Entry(advanced_loc, textvariable=self.weather_lon_var, width=12,
+                  validate='key', validatecommand=num_vcmd).pack(side=tk.LEFT, padx=2)
 
         ttk.Label(weather_group, text="Apply on triggers:").grid(row=8, column=0, sticky=tk.W, pady=5, padx=5)
         triggers_frame = ttk.Frame(weather_group)
         triggers_frame.grid(row=8, column=1, columnspan=2, sticky=tk.W, pady=5, padx=5)
 
-        self.weather_apply_on_vars: Dict[str, tk.BooleanVar] = {}
-        trigger_options = ["startup", "scheduler", "hotkey", "tray", "gui"]
-        for idx, trigger in enumerate(trigger_options):
-            var = tk.BooleanVar(value=trigger in weather_apply_on)
-            self.weather_apply_on_vars[trigger] = var
+        # Vars run parallel to _TRIGGERS; the mapping view is built once for lookups by name
+        self._trigger_vars = [tk.BooleanVar(value=trigger in weather_apply_on) for trigger in self._TRIGGERS]
+        self.weather_apply_on_vars = MappingProxyType(dict(zip(self._TRIGGERS, self._trigger_vars)))
+        for idx, (trigger, var) in enumerate(zip(self._TRIGGERS, self._trigger_vars)):
             ttk.Checkbutton(triggers_frame, text=trigger.title(), variable=var).grid(row=0, column=idx, padx=4, sticky=tk.W)
 
-        # Simple preset/playlist selection for weather
-        ttk.Label(weather_group, text="When weather changes, use:").grid(row=9, column=0, sticky=tk.W, pady=(10, 5), padx=5)
-        weather_mode_frame = ttk.Frame(weather_group)
-        weather_mode_frame.grid(row=9, column=1, columnspan=2, sticky=tk.W, pady=(10, 5), padx=5)
-
-        self.weather_simple_mode_var = tk.StringVar(value="disabled")
-        ttk.Radiobutton(weather_mode_frame, text="Disabled (manual config)", variable=self.weather_simple_mode_var, value="disabled").pack(anchor=tk.W)
-        ttk.Radiobutton(weather_mode_frame, text="Simple mode (coming soon)", variable=self.weather_simple_mode_var, value="simple", state=tk.DISABLED).pack(anchor=tk.W)
-
         ttk.Label(
             weather_group,
             text="💡 For advanced weather→preset mapping, edit the Weather Conditions section below",
-            foreground=self.COLORS['text_muted'],
             justify=tk.LEFT,
-            font=('Segoe UI', 8),
-        ).grid(row=10, column=0, columnspan=3, sticky=tk.W, pady=(5, 0), padx=5)
+            style='Muted.TLabel',
+        ).grid(row=9, column=0, columnspan=3, sticky=tk.W, pady=(10, 0), padx=5)
 
         # Playlist Definitions Editor
         playlists_editor_group = ttk.LabelFrame(scrollable_frame, text="Playlist Definitions (Advanced)", padding=10)
@@ -1527,7 +1929,8 @@ class WallpaperConfigGUI:
             font=('Consolas', 10),
         )
         self.playlists_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        self.playlists_text.insert('1.0', self._format_python_literal(self.playlists_data or []))
+        self._widgets['playlists_text'] = self.playlists_text
+        self._bulk_set_text(self.playlists_text, self._format_python_literal(self.playlists_data or []))
 
         playlist_controls = ttk.Frame(playlists_editor_group)
         playlist_controls.pack(anchor=tk.E, padx=5, pady=(0, 5))
@@ -1551,7 +1954,8 @@ class WallpaperConfigGUI:
             font=('Consolas', 10),
         )
         self.weather_conditions_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        self.weather_conditions_text.insert('1.0', self._format_python_literal((self.weather_settings.get('conditions') if isinstance(self.weather_settings, dict) else {}) or {}))
+        self._widgets['weather_conditions_text'] = self.weather_conditions_text
+        self._bulk_set_text(self.weather_conditions_text, self._format_python_literal((self.weather_settings.get('conditions') if isinstance(self.weather_settings, dict) else {}) or {}))
 
         weather_controls = ttk.Frame(weather_editor_group)
         weather_controls.pack(anchor=tk.E, padx=5, pady=(0, 5))
@@ -1562,294 +1966,134 @@ class WallpaperConfigGUI:
         info_group = ttk.LabelFrame(scrollable_frame, text="ℹ️ Information", padding=10)
         info_group.pack(fill=tk.X, padx=10, pady=5)
 
-        info_text = (
-            "• API Keys are stored securely in the .env file\n"
-            "• Cache directory stores downloaded wallpapers\n"
-            "• Quiet hours prevent wallpaper changes during specified times\n"
-            "• Active days control which days the scheduler runs\n"
-            "• All changes require clicking 'Save Configuration' at the bottom"
-        )
-        ttk.Label(info_group, text=info_text, font=("Arial", 9), justify=tk.LEFT).pack(anchor=tk.W, padx=5, pady=5)
+        ttk.Label(info_group, text=_INFO_TEXT, font=("Arial", 9), justify=tk.LEFT).pack(anchor=tk.W, padx=5, pady=5)
 
-    def _create_help_tab(self) -> None:
-        """Create help tab with detailed explanations of features"""
-        # Create canvas with scrollbar
-        canvas = tk.Canvas(self.help_frame, bg=self.COLORS['bg_primary'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.help_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+    def _weather_var_values(self):
+        """Yield (attribute, variable class, value) for each weather control variable"""
+        settings = self.weather_settings if isinstance(self.weather_settings, dict) else {}
+        location = settings.get("location") or {}
+        for source, spec in ((settings, self._WEATHER_VAR_SPEC), (location, self._WEATHER_LOCATION_VAR_SPEC)):
+            for attr, var_cls, key, default, coerce in spec:
+                raw = source.get(key, default)
+                yield attr, var_cls, default if raw in (None, "") else coerce(raw)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+    def _update_playlist_names(self) -> None:
+        """Recompute the unique playlist names and summary text from playlists_data, and show them"""
+        playlist_names: List[str] = []
+        seen = set()
+        for item in self.playlists_data:
+            if isinstance(item, dict):
+                name = str(item.get("name", "")).strip()
+                if name and name not in seen:
+                    playlist_names.append(name)
+                    seen.add(name)
+        self._playlist_names = playlist_names
+        if playlist_names:
+            self._cached_playlist_summary = "- " + "\n- ".join(playlist_names)
+        else:
+            self._cached_playlist_summary = "No playlists defined yet."
 
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        if hasattr(self, 'default_playlist_combo'):
+            self.default_playlist_combo['values'] = ["(None)"] + playlist_names
+        if hasattr(self, 'playlist_summary_label'):
+            self.playlist_summary_label.configure(text=self._cached_playlist_summary)
 
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+    def _toggle_day_bit(self, idx: int, day_cb: ttk.Checkbutton) -> None:
+        """Flip the active-days mask bit for weekday idx and show the result on its checkbutton"""
+        mask = self._days_mask.get() ^ (1 << idx)
+        self._days_mask.set(mask)
+        # The button has no variable of its own, so the mask is the only source of truth
+        day_cb.state(['selected' if mask & (1 << idx) else '!selected'])
 
-        # Enable mouse wheel scrolling
-        self._bind_mousewheel(canvas)
+    def _create_help_tab(self) -> None:
+        """Create help tab with detailed explanations of features"""
+        if getattr(self, "_help_built", False):
+            return
+        self._help_built = True
 
         # Header
-        header_frame = tk.Frame(scrollable_frame, bg=self.COLORS['bg_secondary'], pady=15)
+        header_frame = tk.Frame(self.help_frame, bg=self.COLORS['bg_secondary'], pady=15)
         header_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        tk.Label(header_frame,
-                text="📚 Advanced Features Guide",
-                bg=self.COLORS['bg_secondary'],
-                fg=self.COLORS['accent'],
-                font=('Segoe UI', 16, 'bold')).pack()
+        ttk.Label(header_frame,
+                 text="📚 Advanced Features Guide",
+                 style='Help.Title.TLabel').pack()
 
-        tk.Label(header_frame,
-                text="Learn how to use Weather Rotation and Playlists to create dynamic wallpaper experiences",
-                bg=self.COLORS['bg_secondary'],
-                fg=self.COLORS['text_secondary'],
-                font=('Segoe UI', 10)).pack(pady=(5, 0))
+        ttk.Label(header_frame,
+                 text="Learn how to use Weather Rotation and Playlists to create dynamic wallpaper experiences",
+                 style='Help.Subtitle.TLabel').pack(pady=(5, 0))
+
+        # Sections, headings and lines live in one tree with native scrolling
+        tree_frame = ttk.Frame(self.help_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+
+        tree = ttk.Treeview(tree_frame, show='tree', selectmode='none', style='Help.Treeview')
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        tree.pack(side="left", fill="both", expand=True)
+
+        tree.tag_configure('section', foreground=self.COLORS['accent'], font=self._fn_section)
+        tree.tag_configure('header', foreground=self.COLORS['accent'], font=self._fn_bold)
+        tree.tag_configure('code', font=self._fn_code)
+
+        def add_lines(parent: str, lines, tag: str = '') -> None:
+            for line in lines:
+                tree.insert(parent, tk.END, text=line, tags=(tag,))
+
+        def add_node(parent: str, text: str, tag: str) -> str:
+            return tree.insert(parent, tk.END, text=text, open=True, tags=(tag,))
 
         # Weather Rotation Section
-        weather_group = ttk.LabelFrame(scrollable_frame, text="🌤️ Weather-Based Rotation", padding=15)
-        weather_group.pack(fill=tk.X, padx=10, pady=10)
-
-        weather_intro = tk.Text(weather_group, wrap=tk.WORD, height=4, bg=self.COLORS['bg_tertiary'],
-                               fg=self.COLORS['text_primary'], font=('Segoe UI', 9), relief=tk.FLAT, padx=10, pady=10)
-        weather_intro.insert("1.0",
-            "Weather Rotation permette di cambiare automaticamente il wallpaper in base alle condizioni meteo della tua posizione. "
-            "Puoi mappare diverse condizioni meteo (sole, pioggia, neve, ecc.) a preset o playlist specifici, creando "
-            "un'esperienza visiva che si adatta all'ambiente esterno.")
-        weather_intro.config(state=tk.DISABLED)
-        weather_intro.pack(fill=tk.X, pady=(0, 10))
+        weather_section = add_node('', "🌤️ Weather-Based Rotation", 'section')
+        add_lines(weather_section, textwrap.wrap(_WEATHER_INTRO, 110))
 
         # How to setup
-        setup_label = tk.Label(weather_group, text="⚙️ Come Configurare:",
-                              bg=self.COLORS['bg_secondary'], fg=self.COLORS['accent'],
-                              font=('Segoe UI', 11, 'bold'))
-        setup_label.pack(anchor=tk.W, pady=(10, 5))
-
-        setup_steps = [
-            "1. Ottieni un API key gratuita da OpenWeatherMap (https://openweathermap.org/api)",
-            "2. Aggiungi la key nel file .env come OPENWEATHER_API_KEY=your_key_here",
-            "3. Nel tab 'Advanced', configura la sezione Weather Rotation:",
-            "   • Abilita Weather Rotation",
-            "   • Imposta la tua posizione (città o coordinate)",
-            "   • Scegli quando applicare la rotazione (startup, scheduler, hotkey)",
-            "   • Imposta l'intervallo di refresh (es. 30 minuti)",
-            "4. Configura le mappature meteo → preset/playlist nella sezione 'Weather Mapping'"
-        ]
-
-        for step in setup_steps:
-            step_label = tk.Label(weather_group, text=step,
-                                 bg=self.COLORS['bg_secondary'], fg=self.COLORS['text_primary'],
-                                 font=('Segoe UI', 9), justify=tk.LEFT)
-            step_label.pack(anchor=tk.W, padx=20, pady=2)
+        add_lines(add_node(weather_section, "⚙️ Come Configurare:", 'header'), _SETUP_STEPS)
 
         # Weather conditions example
-        conditions_label = tk.Label(weather_group, text="☁️ Condizioni Supportate:",
-                                   bg=self.COLORS['bg_secondary'], fg=self.COLORS['accent'],
-                                   font=('Segoe UI', 11, 'bold'))
-        conditions_label.pack(anchor=tk.W, pady=(15, 5))
-
-        conditions_text = tk.Text(weather_group, wrap=tk.WORD, height=8, bg=self.COLORS['bg_tertiary'],
-                                 fg=self.COLORS['text_primary'], font=('Consolas', 9), relief=tk.FLAT, padx=10, pady=10)
-        conditions_text.insert("1.0",
-            "• clear          → Cielo sereno\n"
-            "• clouds         → Nuvoloso\n"
-            "• rain           → Pioggia\n"
-            "• drizzle        → Pioggerella\n"
-            "• snow           → Neve\n"
-            "• thunderstorm   → Temporale\n"
-            "• mist/fog       → Nebbia\n"
-            "• storm          → Tempesta\n"
-            "• night_clear    → Notte serena (usa il prefisso 'night_' per condizioni notturne)\n"
-            "• default        → Fallback per condizioni non mappate")
-        conditions_text.config(state=tk.DISABLED)
-        conditions_text.pack(fill=tk.X, pady=(0, 10))
+        add_lines(add_node(weather_section, "☁️ Condizioni Supportate:", 'header'), _WEATHER_CONDITIONS_HELP, 'code')
 
         # Example config
-        example_label = tk.Label(weather_group, text="📝 Esempio Configurazione (config.py):",
-                                bg=self.COLORS['bg_secondary'], fg=self.COLORS['accent'],
-                                font=('Segoe UI', 11, 'bold'))
-        example_label.pack(anchor=tk.W, pady=(15, 5))
-
-        example_text = tk.Text(weather_group, wrap=tk.NONE, height=15, bg=self.COLORS['bg_tertiary'],
-                              fg=self.COLORS['text_primary'], font=('Consolas', 8), relief=tk.FLAT, padx=10, pady=10)
-        example_text.insert("1.0",
-            'WeatherRotationSettings = {\n'
-            '    "enabled": True,\n'
-            '    "provider": "openweathermap",\n'
-            '    "api_key": os.getenv("OPENWEATHER_API_KEY"),\n'
-            '    "refresh_minutes": 30,\n'
-            '    "apply_on": ["startup", "scheduler", "hotkey"],\n'
-            '    "units": "metric",\n'
-            '    "location": {\n'
-            '        "city": "Milan",\n'
-            '        "country": "IT",\n'
-            '    },\n'
-            '    "conditions": {\n'
-            '        "clear": {"playlist": "focus_day"},\n'
-            '        "night_clear": {"playlist": "after_hours"},\n'
-            '        "rain": {"preset": "relax"},\n'
-            '        "snow": {"preset": "relax"},\n'
-            '        "default": {"playlist": "focus_day"},\n'
-            '    },\n'
-            '}')
-        example_text.config(state=tk.DISABLED)
-        example_text.pack(fill=tk.X)
+        add_lines(add_node(weather_section, "📝 Esempio Configurazione (config.py):", 'header'), _WEATHER_EXAMPLE_CFG, 'code')
 
         # Playlists Section
-        playlist_group = ttk.LabelFrame(scrollable_frame, text="🎵 Playlists System", padding=15)
-        playlist_group.pack(fill=tk.X, padx=10, pady=10)
-
-        playlist_intro = tk.Text(playlist_group, wrap=tk.WORD, height=4, bg=self.COLORS['bg_tertiary'],
-                                fg=self.COLORS['text_primary'], font=('Segoe UI', 9), relief=tk.FLAT, padx=10, pady=10)
-        playlist_intro.insert("1.0",
-            "Le Playlist permettono di creare sequenze tematiche di preset che vengono applicati in rotazione. "
-            "Ogni entry nella playlist può avere un 'weight' (peso) che determina quante volte appare nella sequenza, "
-            "override per monitor specifici, e provider/query personalizzati. Ideali per creare esperienze contestuali "
-            "(es. focus durante il giorno, relax la sera).")
-        playlist_intro.config(state=tk.DISABLED)
-        playlist_intro.pack(fill=tk.X, pady=(0, 10))
+        playlist_section = add_node('', "🎵 Playlists System", 'section')
+        add_lines(playlist_section, textwrap.wrap(_PLAYLIST_INTRO, 110))
 
         # Playlist structure
-        structure_label = tk.Label(playlist_group, text="🏗️ Struttura di una Playlist:",
-                                  bg=self.COLORS['bg_secondary'], fg=self.COLORS['accent'],
-                                  font=('Segoe UI', 11, 'bold'))
-        structure_label.pack(anchor=tk.W, pady=(10, 5))
-
-        structure_points = [
-            "• name: Identificatore univoco (lowercase)",
-            "• title: Nome visualizzato nell'interfaccia",
-            "• description: Breve descrizione dello scopo",
-            "• tags: Array di tag per categorizzare",
-            "• entries: Array di step che compongono la playlist"
-        ]
-
-        for point in structure_points:
-            point_label = tk.Label(playlist_group, text=point,
-                                  bg=self.COLORS['bg_secondary'], fg=self.COLORS['text_primary'],
-                                  font=('Segoe UI', 9), justify=tk.LEFT)
-            point_label.pack(anchor=tk.W, padx=20, pady=2)
+        add_lines(add_node(playlist_section, "🏗️ Struttura di una Playlist:", 'header'), _STRUCTURE_POINTS)
 
         # Entry structure
-        entry_label = tk.Label(playlist_group, text="📋 Struttura di una Entry:",
-                              bg=self.COLORS['bg_secondary'], fg=self.COLORS['accent'],
-                              font=('Segoe UI', 11, 'bold'))
-        entry_label.pack(anchor=tk.W, pady=(15, 5))
-
-        entry_points = [
-            "• preset: Nome del preset da utilizzare (richiesto)",
-            "• weight: Numero di volte che appare in rotazione (default: 1)",
-            "• provider: Override del provider per questo step (opzionale)",
-            "• query: Query specifica per questo step (opzionale)",
-            "• title: Titolo descrittivo dello step (opzionale)",
-            "• monitors: Override specifici per monitor (opzionale)"
-        ]
-
-        for point in entry_points:
-            point_label = tk.Label(playlist_group, text=point,
-                                  bg=self.COLORS['bg_secondary'], fg=self.COLORS['text_primary'],
-                                  font=('Segoe UI', 9), justify=tk.LEFT)
-            point_label.pack(anchor=tk.W, padx=20, pady=2)
+        add_lines(add_node(playlist_section, "📋 Struttura di una Entry:", 'header'), _ENTRY_POINTS)
 
         # Playlist example
-        playlist_example_label = tk.Label(playlist_group, text="📝 Esempio Playlist (config.py):",
-                                         bg=self.COLORS['bg_secondary'], fg=self.COLORS['accent'],
-                                         font=('Segoe UI', 11, 'bold'))
-        playlist_example_label.pack(anchor=tk.W, pady=(15, 5))
-
-        playlist_example_text = tk.Text(playlist_group, wrap=tk.NONE, height=25, bg=self.COLORS['bg_tertiary'],
-                                       fg=self.COLORS['text_primary'], font=('Consolas', 8), relief=tk.FLAT, padx=10, pady=10)
-        playlist_example_text.insert("1.0",
-            'Playlists = [\n'
-            '    {\n'
-            '        "name": "focus_day",\n'
-            '        "title": "Focus Daylight",\n'
-            '        "description": "Rotazione energizzante per il giorno",\n'
-            '        "tags": ["daytime", "focus"],\n'
-            '        "entries": [\n'
-            '            {\n'
-            '                "title": "Deep Focus",\n'
-            '                "preset": "workspace",\n'
-            '                "weight": 3,  # Appare 3 volte su 4\n'
-            '                "provider": "wallhaven",\n'
-            '                "monitors": {\n'
-            '                    "0": {"preset": "workspace"},  # Monitor index\n'
-            '                    "Full HD": {"provider": "wallhaven"},  # Monitor name\n'
-            '                    "Ultrawide": {"query": "technology"},\n'
-            '                },\n'
-            '            },\n'
-            '            {\n'
-            '                "title": "Mental Break",\n'
-            '                "preset": "relax",\n'
-            '                "weight": 1,  # Appare 1 volta su 4\n'
-            '                "provider": "pexels",\n'
-            '                "query": "nature landscape",\n'
-            '            },\n'
-            '        ],\n'
-            '    },\n'
-            ']\n\n'
-            '# Imposta la playlist di default\n'
-            'DefaultPlaylist = "focus_day"')
-        playlist_example_text.config(state=tk.DISABLED)
-        playlist_example_text.pack(fill=tk.X)
+        add_lines(add_node(playlist_section, "📝 Esempio Playlist (config.py):", 'header'), _PLAYLIST_EXAMPLE, 'code')
 
         # How to use
-        usage_label = tk.Label(playlist_group, text="🚀 Come Usare le Playlist:",
-                              bg=self.COLORS['bg_secondary'], fg=self.COLORS['accent'],
-                              font=('Segoe UI', 11, 'bold'))
-        usage_label.pack(anchor=tk.W, pady=(15, 5))
-
-        usage_steps = [
-            "1. Definisci le tue playlist nell'array 'Playlists' in config.py",
-            "2. Imposta 'DefaultPlaylist' con il nome di una playlist (opzionale)",
-            "3. Usa Weather Rotation per mappare condizioni meteo a playlist specifiche",
-            "4. Il sistema ruoterà automaticamente tra gli step della playlist attiva",
-            "5. Gli step con weight maggiore appariranno più frequentemente nella rotazione"
-        ]
-
-        for step in usage_steps:
-            step_label = tk.Label(playlist_group, text=step,
-                                 bg=self.COLORS['bg_secondary'], fg=self.COLORS['text_primary'],
-                                 font=('Segoe UI', 9), justify=tk.LEFT)
-            step_label.pack(anchor=tk.W, padx=20, pady=2)
+        add_lines(add_node(playlist_section, "🚀 Come Usare le Playlist:", 'header'), _USAGE_STEPS)
 
         # Tips section
-        tips_group = ttk.LabelFrame(scrollable_frame, text="💡 Tips & Best Practices", padding=15)
-        tips_group.pack(fill=tk.X, padx=10, pady=10)
-
-        tips = [
-            "✓ Combina Weather Rotation e Playlist per esperienze contestuali automatiche",
-            "✓ Usa weight elevati per preset preferiti che vuoi vedere più spesso",
-            "✓ Gli override per monitor permettono configurazioni diverse per ogni schermo",
-            "✓ Testa le configurazioni meteo usando diverse condizioni nel tab Advanced",
-            "✓ Refresh meteo ogni 30-60 minuti è sufficiente per la maggior parte degli usi",
-            "✓ Crea playlist tematiche (focus, relax, serale) per diverse situazioni",
-            "✓ Usa il prefisso 'night_' nelle condizioni meteo per wallpaper notturni specifici",
-        ]
-
-        for tip in tips:
-            tip_label = tk.Label(tips_group, text=tip,
-                                bg=self.COLORS['bg_secondary'], fg=self.COLORS['text_primary'],
-                                font=('Segoe UI', 9), justify=tk.LEFT)
-            tip_label.pack(anchor=tk.W, padx=10, pady=3)
+        add_lines(add_node('', "💡 Tips & Best Practices", 'section'), _TIPS_LINES)
 
     def _create_logs_tab(self) -> None:
         """Create logs tab to display application logs"""
+        bg_primary = self.COLORS['bg_primary']
+
         # Main container
-        container = tk.Frame(self.logs_frame, bg=self.COLORS['bg_primary'])
+        container = tk.Frame(self.logs_frame, bg=bg_primary)
         container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Title
         title_label = tk.Label(container,
                               text="📋 Application Logs",
-                              bg=self.COLORS['bg_primary'],
+                              bg=bg_primary,
                               fg=self.COLORS['accent'],
-                              font=('Segoe UI', 14, 'bold'))
+                              font=self._fn_title)
         title_label.pack(pady=(0, 10))
 
         # Control buttons frame
-        controls_frame = tk.Frame(container, bg=self.COLORS['bg_primary'])
+        controls_frame = tk.Frame(container, bg=bg_primary)
         controls_frame.pack(fill=tk.X, pady=(0, 10))
 
         # Refresh button
@@ -1857,7 +2101,7 @@ class WallpaperConfigGUI:
                                text="🔄 Refresh Logs",
                                bg=self.COLORS['accent'],
                                fg='#1e1e2e',
-                               font=('Segoe UI', 9, 'bold'),
+                               font=self._fn_button,
                                relief=tk.FLAT,
                                cursor='hand2',
                                padx=15,
@@ -1878,7 +2122,7 @@ class WallpaperConfigGUI:
                              text="🗑️ Clear Logs",
                              bg=self.COLORS['error'],
                              fg='#1e1e2e',
-                             font=('Segoe UI', 9, 'bold'),
+                             font=self._fn_button,
                              relief=tk.FLAT,
                              cursor='hand2',
                              padx=15,
@@ -1899,7 +2143,7 @@ class WallpaperConfigGUI:
                                wrap=tk.WORD,
                                bg=self.COLORS['bg_secondary'],
                                fg=self.COLORS['text_primary'],
-                               font=('Consolas', 9),
+                               font=self._fn_code,
                                yscrollcommand=scrollbar.set,
                                relief=tk.FLAT,
                                padx=10,
@@ -1913,57 +2157,88 @@ class WallpaperConfigGUI:
         self.log_text.tag_config('ERROR', foreground=self.COLORS['error'])
         self.log_text.tag_config('DEBUG', foreground=self.COLORS['text_muted'])
 
-        # Load initial logs
-        self._refresh_logs()
+        # Initial logs are loaded when the tab is first shown
+        self._logs_loaded = False
+        self._log_pos = 0
+        self._log_inode = None
+        self._refresh_after_id = None
 
     def _refresh_logs(self) -> None:
-        """Refresh the log display"""
+        """Refresh the log display, appending only lines written since the last read"""
         try:
             log_path = Path(__file__).parent / "wallpaperchanger.log"
 
             if not log_path.exists():
+                self._log_pos = 0
                 self.log_text.delete(1.0, tk.END)
                 self.log_text.insert(tk.END, "No log file found.\n\n", 'INFO')
                 self.log_text.insert(tk.END, "The log file will be created when the Wallpaper Changer service starts.\n", 'INFO')
                 return
 
-            # Read log file
-            with open(log_path, 'r', encoding='utf-8') as f:
-                logs = f.read()
+            stat = log_path.stat()
+            # First read, or the file was replaced or truncated: reload the tail only
+            reload = (self._log_pos == 0 or stat.st_ino != self._log_inode
+                      or stat.st_size < self._log_pos)
+            self._log_inode = stat.st_ino
+            if not reload and stat.st_size == self._log_pos:
+                return
+            start = max(0, stat.st_size - self._LOG_TAIL_BYTES) if reload else self._log_pos
+
+            with open(log_path, 'rb') as f:
+                f.seek(start)
+                chunk = f.read()
 
-            # Clear current content
-            self.log_text.delete(1.0, tk.END)
+            # Leave a partially written last line for the next refresh
+            end = chunk.rfind(b'\n') + 1
+            self._log_pos = start + end
+            logs = chunk[:end].decode('utf-8', 'replace').replace('\r\n', '\n')
 
-            # Parse and colorize logs
-            for line in logs.splitlines():
-                if ' - INFO - ' in line:
-                    self.log_text.insert(tk.END, line + '\n', 'INFO')
-                elif ' - WARNING - ' in line:
-                    self.log_text.insert(tk.END, line + '\n', 'WARNING')
-                elif ' - ERROR - ' in line:
-                    self.log_text.insert(tk.END, line + '\n', 'ERROR')
-                elif ' - DEBUG - ' in line:
-                    self.log_text.insert(tk.END, line + '\n', 'DEBUG')
-                else:
-                    self.log_text.insert(tk.END, line + '\n')
+            if reload and start > 0:
+                # Drop the line cut by seeking into the middle of the file
+                logs = logs.partition('\n')[2]
+            if not logs and not reload:
+                return
+
+            # One insert carrying every run of same-level lines with its tag
+            tagged = []
+            for run_start, run_end, tag in _log_runs(logs):
+                tagged += (logs[run_start:run_end], tag)
+            if reload:
+                self._bulk_set_text(self.log_text, *tagged)
+            elif tagged:
+                self.log_text.insert(tk.END, *tagged)
+
+            # Keep only the newest lines so the widget does not grow without bound
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > self._LOG_MAX_LINES:
+                self.log_text.delete('1.0', f"{line_count - self._LOG_MAX_LINES + 1}.0")
 
             # Auto-scroll to bottom
             self.log_text.see(tk.END)
 
         except Exception as e:
+            self._log_pos = 0
             self.log_text.delete(1.0, tk.END)
             self.log_text.insert(tk.END, f"Error reading log file: {e}\n", 'ERROR')
 
     def _toggle_auto_refresh(self) -> None:
         """Toggle auto-refresh of logs"""
+        self._cancel_auto_refresh()
         if self.auto_refresh_var.get():
             self._auto_refresh_logs()
 
     def _auto_refresh_logs(self) -> None:
         """Auto-refresh logs every 3 seconds"""
+        self._refresh_after_id = None
         if self.auto_refresh_var.get():
             self._refresh_logs()
-            self.root.after(3000, self._auto_refresh_logs)
+            self._refresh_after_id = self.root.after(3000, self._auto_refresh_logs)
+
+    def _cancel_auto_refresh(self) -> None:
+        """Cancel a pending auto-refresh, if any"""
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
 
     def _clear_logs_file(self) -> None:
         """Clear the log file"""
@@ -1983,76 +2258,86 @@ class WallpaperConfigGUI:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to clear logs: {e}")
 
-    def _get_config_content(self) -> str:
-        """Get config.py content"""
-        try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except:
-            return ""
-
-
     def _format_python_literal(self, value: Any) -> str:
         """Pretty format Python literals for editor areas."""
-        try:
-            return pprint.pformat(value, width=100, sort_dicts=False)
-        except Exception:
-            return repr(value)
+        key = repr(value)
+        formatted = self._literal_format_cache.get(key)
+        if formatted is None:
+            try:
+                formatted = _dump_literal(value)
+            except Exception:
+                formatted = key
+            if len(self._literal_format_cache) >= 8:
+                self._literal_format_cache.clear()
+            self._literal_format_cache[key] = formatted
+        return formatted
+
+    def _bulk_set_text(self, widget, *chunks) -> None:
+        """Replace a text widget's content in one insert, without recording undo steps
+
+        chunks are passed to insert() as-is: text, optionally followed by tags, text, tags...
+        """
+        undo = widget.cget('undo')
+        widget.configure(undo=False)
+        widget.delete('1.0', tk.END)
+        if chunks:
+            widget.insert(tk.END, *chunks)
+        widget.configure(undo=undo)
+        widget.edit_reset()
 
     def _format_playlists_text(self) -> None:
-        if not hasattr(self, 'playlists_text'):
+        editor = self._widgets.get('playlists_text')
+        if editor is None:
             return
-        raw = self.playlists_text.get('1.0', tk.END).strip() or '[]'
+        raw = editor.get('1.0', tk.END).strip() or '[]'
         try:
-            data = ast.literal_eval(raw)
+            formatted = _reformat_literal(raw)
         except Exception as error:
             messagebox.showerror("Playlists", f"Unable to parse playlists: {error}")
             return
-        self.playlists_text.delete('1.0', tk.END)
-        self.playlists_text.insert('1.0', self._format_python_literal(data))
+        self._bulk_set_text(editor, formatted)
 
     def _reset_playlists_text(self) -> None:
-        if hasattr(self, 'playlists_text'):
-            self.playlists_text.delete('1.0', tk.END)
-            self.playlists_text.insert('1.0', self._format_python_literal(self.playlists_data or []))
+        editor = self._widgets.get('playlists_text')
+        if editor is not None:
+            self._bulk_set_text(editor, self._format_python_literal(self.playlists_data or []))
 
     def _format_weather_conditions_text(self) -> None:
-        if not hasattr(self, 'weather_conditions_text'):
+        editor = self._widgets.get('weather_conditions_text')
+        if editor is None:
             return
-        raw = self.weather_conditions_text.get('1.0', tk.END).strip() or '{}'
+        raw = editor.get('1.0', tk.END).strip() or '{}'
         try:
-            data = ast.literal_eval(raw)
+            formatted = _reformat_literal(raw)
         except Exception as error:
             messagebox.showerror("Weather Mapping", f"Unable to parse conditions: {error}")
             return
-        self.weather_conditions_text.delete('1.0', tk.END)
-        self.weather_conditions_text.insert('1.0', self._format_python_literal(data))
+        self._bulk_set_text(editor, formatted)
 
     def _reset_weather_conditions_text(self) -> None:
-        if hasattr(self, 'weather_conditions_text'):
+        editor = self._widgets.get('weather_conditions_text')
+        if editor is not None:
             conditions = {}
             if isinstance(self.weather_settings, dict):
                 conditions = self.weather_settings.get('conditions') or {}
-            self.weather_conditions_text.delete('1.0', tk.END)
-            self.weather_conditions_text.insert('1.0', self._format_python_literal(conditions))
+            self._bulk_set_text(editor, self._format_python_literal(conditions))
+
+    def _focus_editor(self, name: str) -> None:
+        """Focus a registered editor widget, if its tab has been built"""
+        editor = self._widgets.get(name)
+        if editor is not None:
+            editor.focus_set()
 
     def _focus_playlists_editor(self) -> None:
         self.notebook.select(self.advanced_frame)
-        self.root.after(150, lambda: self.playlists_text.focus_set() if hasattr(self, 'playlists_text') else None)
+        self.root.after(150, self._focus_editor, 'playlists_text')
 
     def _focus_weather_editor(self) -> None:
         self.notebook.select(self.advanced_frame)
-        self.root.after(150, lambda: self.weather_conditions_text.focus_set() if hasattr(self, 'weather_conditions_text') else None)
+        self.root.after(150, self._focus_editor, 'weather_conditions_text')
 
     def _test_weather_connection(self) -> None:
         """Test the weather API connection and show current weather"""
-        import requests
-
-        # Update UI
-        self.weather_status_label.config(text="🔄 Testing connection...", fg=self.COLORS['warning'])
-        self.test_weather_btn.config(state=tk.DISABLED)
-        self.root.update()
-
         # Get values
         api_key = self.weather_api_key_var.get().strip()
         city = self.weather_city_var.get().strip()
@@ -2067,7 +2352,6 @@ class WallpaperConfigGUI:
                 text="❌ Error: Please enter an API key first!",
                 fg=self.COLORS['error']
             )
-            self.test_weather_btn.config(state=tk.NORMAL)
             return
 
         # Build params
@@ -2086,7 +2370,6 @@ class WallpaperConfigGUI:
                     text="❌ Error: Latitude and Longitude must be numbers!",
                     fg=self.COLORS['error']
                 )
-                self.test_weather_btn.config(state=tk.NORMAL)
                 return
         elif city:
             query = city if not country else f"{city},{country}"
@@ -2097,12 +2380,29 @@ class WallpaperConfigGUI:
                 text="❌ Error: Please enter either City name or Latitude/Longitude!",
                 fg=self.COLORS['error']
             )
-            self.test_weather_btn.config(state=tk.NORMAL)
             return
 
-        # Make request
+        # Reuse a successful result for the same settings within the TTL
+        cache_key = (api_key, lat, lon, city, country, units)
+        cached = self._weather_test_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self._WEATHER_TEST_TTL:
+            self.weather_status_label.config(text=cached[1] + "\n\n(cached)", fg=self.COLORS['success'])
+            return
+
+        # Update UI, then make the request off the Tk thread
+        self.weather_status_label.config(text="🔄 Testing connection...", fg=self.COLORS['warning'])
+        self.test_weather_btn.config(state=tk.DISABLED)
+        threading.Thread(
+            target=self._run_weather_test,
+            args=(params, location_str, units, cache_key),
+            daemon=True,
+        ).start()
+
+    def _run_weather_test(self, params: Dict[str, Any], location_str: str, units: str, cache_key: tuple) -> None:
+        """Worker: query OpenWeatherMap and hand the status text back to the Tk thread"""
+        ok = False
         try:
-            response = requests.get(
+            response = self._http.get(
                 "https://api.openweathermap.org/data/2.5/weather",
                 params=params,
                 timeout=10
@@ -2124,7 +2424,7 @@ class WallpaperConfigGUI:
             temp_unit = "°C" if units == "metric" else ("°F" if units == "imperial" else "K")
 
             # Success message
-            success_text = (
+            status_text = (
                 f"✅ Connection successful!\n\n"
                 f"📍 Location: {city_name}\n"
                 f"☁️ Condition: {main_condition} ({description})\n"
@@ -2132,15 +2432,11 @@ class WallpaperConfigGUI:
                 f"💧 Humidity: {humidity}%\n\n"
                 f"✨ Your weather API is working! This condition would be mapped as: '{main_condition.lower()}'"
             )
-
-            self.weather_status_label.config(
-                text=success_text,
-                fg=self.COLORS['success']
-            )
+            ok = True
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
-                error_text = (
+                status_text = (
                     "❌ API Key Error: Invalid or unauthorized API key.\n\n"
                     "⏰ IMPORTANT: If you just created the API key, it can take up to 2 HOURS to activate!\n"
                     "OpenWeatherMap says it's active in your account, but the backend needs time to propagate.\n\n"
@@ -2151,29 +2447,34 @@ class WallpaperConfigGUI:
                     "💡 TIP: Try again in 15-30 minutes if you just created it."
                 )
             elif e.response.status_code == 404:
-                error_text = (
+                status_text = (
                     f"❌ Location Error: '{location_str}' not found.\n\n"
                     "Please check your city name or try using latitude/longitude instead."
                 )
             else:
-                error_text = f"❌ HTTP Error {e.response.status_code}: {str(e)}"
-
-            self.weather_status_label.config(text=error_text, fg=self.COLORS['error'])
+                status_text = f"❌ HTTP Error {e.response.status_code}: {str(e)}"
 
         except requests.exceptions.Timeout:
-            self.weather_status_label.config(
-                text="❌ Connection timeout. Please check your internet connection.",
-                fg=self.COLORS['error']
-            )
+            status_text = "❌ Connection timeout. Please check your internet connection."
 
         except Exception as e:
-            self.weather_status_label.config(
-                text=f"❌ Error: {str(e)}",
-                fg=self.COLORS['error']
-            )
+            status_text = f"❌ Error: {str(e)}"
+
+        try:
+            self.root.after(0, self._finish_weather_test, status_text, ok, cache_key)
+        except (RuntimeError, tk.TclError):
+            # Window closed while the request was in flight
+            pass
 
-        finally:
-            self.test_weather_btn.config(state=tk.NORMAL)
+    def _finish_weather_test(self, status_text: str, ok: bool, cache_key: tuple) -> None:
+        """Show the weather test result and re-enable the test button"""
+        if ok:
+            self._weather_test_cache[cache_key] = (time.monotonic(), status_text)
+        self.weather_status_label.config(
+            text=status_text,
+            fg=self.COLORS['success'] if ok else self.COLORS['error']
+        )
+        self.test_weather_btn.config(state=tk.NORMAL)
 
     def _toggle_password_visibility(self, entry_widget) -> None:
         """Toggle password visibility for API key fields"""
@@ -2187,45 +2488,27 @@ class WallpaperConfigGUI:
         if directory:
             var.set(directory)
 
+    def _env_file_content(self) -> Tuple[Path, str]:
+        """Path and text of the .env file for the API keys currently entered"""
+        env_path = Path(__file__).parent / '.env'
+        wallhaven_key = self.wallhaven_key_var.get().strip()
+        pexels_key = self.pexels_key_var.get().strip()
+        openweather_key = self.weather_api_key_var.get().strip() if hasattr(self, 'weather_api_key_var') else ""
+
+        return env_path, _ENV_TEMPLATE.format(wallhaven=wallhaven_key, pexels=pexels_key,
+                                              openweather=openweather_key)
+
     def _save_api_keys(self) -> None:
         """Save API keys to .env file"""
         try:
-            env_path = Path(__file__).parent / '.env'
-            wallhaven_key = self.wallhaven_key_var.get().strip()
-            pexels_key = self.pexels_key_var.get().strip()
-            openweather_key = self.weather_api_key_var.get().strip() if hasattr(self, 'weather_api_key_var') else ""
-
-            content = f"""# Wallhaven API Key from https://wallhaven.cc/settings/account
-WALLHAVEN_API_KEY={wallhaven_key}
-
-# Pexels API Key from https://www.pexels.com/api/new/
-PEXELS_API_KEY={pexels_key}
-
-# OpenWeatherMap API Key from https://home.openweathermap.org/api_keys
-# Free tier: 1000 calls/day (more than enough!)
-OPENWEATHER_API_KEY={openweather_key}
-"""
-            with open(env_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
+            _write_file_atomic(*self._env_file_content())
             messagebox.showinfo("Success", "API Keys saved successfully to .env file!\n\nAll API keys (Wallhaven, Pexels, OpenWeatherMap) have been saved.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save API keys: {e}")
 
     def _load_monitors(self) -> None:
         """Load available monitors"""
-        from main import enumerate_monitors_user32, DesktopWallpaperController
-
-        monitors = []
-        try:
-            manager = DesktopWallpaperController()
-            monitors = manager.enumerate_monitors()
-            manager.close()
-        except Exception:
-            try:
-                monitors = enumerate_monitors_user32()
-            except Exception:
-                pass
+        monitors = self._get_monitors()
 
         monitor_options = ["All Monitors"]
         for idx, mon in enumerate(monitors):
@@ -2234,17 +2517,63 @@ OPENWEATHER_API_KEY={openweather_key}
         self.monitor_combo['values'] = monitor_options
         self.monitors_data = monitors
 
-    def _refresh_gallery(self) -> None:
-        """Refresh wallpaper gallery"""
-        # Clear existing items
-        for widget in self.gallery_frame.winfo_children():
-            widget.destroy()
+    def _scan_cache_entries(self, results: queue.Queue) -> None:
+        """Worker thread: read the cache index and folder listing off the Tk thread"""
+        results.put((self.cache_manager.list_entries(), self._list_cache_files()))
 
-        # Clear thumbnail cache
-        self.thumbnail_cache.clear()
+    def _poll_gallery_scan(self, results: queue.Queue) -> None:
+        """Show the gallery once the background scan has finished (Tk thread)"""
+        try:
+            entries, cached_files = results.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_gallery_scan, results)
+            return
+        self._show_gallery_entries(entries, cached_files)
 
+    def _refresh_gallery(self) -> None:
+        """Refresh wallpaper gallery"""
         # Get cached items
         entries = self.cache_manager.list_entries()
+        cached_files = self._list_cache_files()
+        if self._thumb_cards and (_entries_key(entries), cached_files) == self._shown_entries_key:
+            return  # Neither the index nor the files on disk changed since the last render
+        self._show_gallery_entries(entries, cached_files)
+
+    def _list_cache_files(self) -> Dict[str, int]:
+        """Map each file in the cache folder to its mtime_ns with one directory listing"""
+        try:
+            with os.scandir(self.cache_manager.cache_dir) as it:
+                return {e.path: e.stat().st_mtime_ns for e in it if e.is_file()}
+        except OSError:
+            return {}
+
+    def _reset_gallery_frame(self) -> None:
+        """Replace the gallery frame with an empty one, tearing down every card in one destroy"""
+        self.gallery_frame.destroy()
+        self.gallery_frame = ttk.Frame(self.gallery_canvas)
+        self._bind_scrollregion(self.gallery_frame, self.gallery_canvas)
+        self.gallery_canvas.itemconfigure(self._gallery_window, window=self.gallery_frame)
+
+    def _show_gallery_entries(self, entries: List[Dict[str, Any]],
+                              cached_files: Optional[Dict[str, int]] = None) -> None:
+        """Render cache entries, or a notice when the cache is empty"""
+        # Clear existing items
+        self._reset_gallery_frame()
+        self._thumb_cards = []
+        self._pending_cards = []
+
+        # One directory listing instead of a stat per card
+        if cached_files is None:
+            cached_files = self._list_cache_files()
+        self._cached_files = cached_files
+        self._shown_entries_key = (_entries_key(entries), cached_files)
+        # Keep thumbnails and sizes whose file is unchanged; drop deleted or rewritten ones
+        self.thumbnail_cache = {key: value for key, value in self.thumbnail_cache.items()
+                                if key[0] in self._cached_files and self._thumb_key(key[0]) == key}
+        self._resolution_cache = {key: value for key, value in self._resolution_cache.items()
+                                  if key[0] in self._cached_files and self._thumb_key(key[0]) == key}
+        threading.Thread(target=self._prune_thumb_dir,
+                         args=([e["path"] for e in entries if e.get("path")],), daemon=True).start()
 
         if not entries:
             info_frame = ttk.Frame(self.gallery_frame)
@@ -2257,14 +2586,11 @@ OPENWEATHER_API_KEY={openweather_key}
             ttk.Label(info_frame, text=f"Cache location: {self.cache_manager.cache_dir}",
                      font=("Arial", 9), foreground="gray").pack(pady=5)
 
-            # Check if cache directory exists
-            if os.path.exists(self.cache_manager.cache_dir):
-                cache_files = [f for f in os.listdir(self.cache_manager.cache_dir)
-                              if f.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp'))]
-                if cache_files:
-                    ttk.Label(info_frame,
-                             text=f"Found {len(cache_files)} image files in cache, but index may be empty.",
-                             font=("Arial", 9), foreground="orange").pack(pady=5)
+            image_count = sum(1 for path in cached_files if path.rpartition(".")[2].lower() in _IMG_EXTS)
+            if image_count:
+                ttk.Label(info_frame,
+                         text=f"Found {image_count} image files in cache, but index may be empty.",
+                         font=("Arial", 9), foreground="orange").pack(pady=5)
             return
 
         # Store ALL entries for filtering/sorting
@@ -2280,17 +2606,17 @@ OPENWEATHER_API_KEY={openweather_key}
 
         filtered_entries = list(self.all_entries)
 
-        # Apply resolution filter
+        # Apply resolution filter; sizes are only looked up when a filter or sort needs them
         filter_val = self.filter_resolution.get()
         if filter_val != "All":
             min_width = int(filter_val.split('x')[0].replace('+', ''))
             min_height = int(filter_val.split('x')[1].replace('+', ''))
 
-            filtered_entries = [
-                e for e in filtered_entries
-                if self._get_image_resolution(e)[0] >= min_width and
-                   self._get_image_resolution(e)[1] >= min_height
-            ]
+            def fits(e: Dict[str, Any]) -> bool:
+                width, height = self._get_image_resolution(e)
+                return width >= min_width and height >= min_height
+
+            filtered_entries = [e for e in filtered_entries if fits(e)]
 
         # Apply sorting
         sort_val = self.sort_by.get()
@@ -2299,45 +2625,62 @@ OPENWEATHER_API_KEY={openweather_key}
         elif sort_val == "Oldest First":
             filtered_entries = list(reversed(filtered_entries))
         elif sort_val == "Highest Resolution":
-            filtered_entries.sort(key=lambda e: self._get_image_resolution(e)[0] * self._get_image_resolution(e)[1], reverse=True)
+            filtered_entries.sort(key=self._image_area, reverse=True)
         elif sort_val == "Lowest Resolution":
-            filtered_entries.sort(key=lambda e: self._get_image_resolution(e)[0] * self._get_image_resolution(e)[1])
+            filtered_entries.sort(key=self._image_area)
 
         # Limit to 50 for performance
         self.cached_entries = filtered_entries[:50]
+        self._thumb_cards = []  # Entry list changed, cards must be rebuilt
 
         # Calculate responsive columns based on window width
         self._layout_thumbnails()
 
+    def _image_exists(self, image_path: str) -> bool:
+        """Check a cached image against the last directory listing; stat only paths outside it"""
+        return image_path in self._cached_files or os.path.exists(image_path)
+
+    def _thumb_key(self, image_path: str) -> Tuple[str, Optional[int]]:
+        """thumbnail_cache key: the path plus its mtime from the last directory listing"""
+        return image_path, self._cached_files.get(image_path)
+
+    def _image_area(self, entry: Dict[str, Any]) -> int:
+        """Pixel count of an entry's image, the resolution sort key"""
+        width, height = self._get_image_resolution(entry)
+        return width * height
+
     def _get_image_resolution(self, entry: Dict[str, Any]) -> Tuple[int, int]:
-        """Get image resolution from entry or file"""
+        """Get image resolution from entry or file; file lookups are memoized by (path, mtime)"""
         # Try to get from cache metadata first
         if 'width' in entry and 'height' in entry:
             return (entry['width'], entry['height'])
 
-        # Try to read from image file
+        image_path = entry.get("path", "")
+        key = self._thumb_key(image_path)
+        size = self._resolution_cache.get(key)
+        if size is not None:
+            return size
+
+        size = (0, 0)  # Default if unable to determine
+        # Image.open only parses the header, so .size never decodes pixel data
         try:
-            image_path = entry.get("path", "")
-            if image_path and os.path.exists(image_path):
+            if image_path and self._image_exists(image_path):
                 with Image.open(image_path) as img:
-                    return img.size
+                    size = img.size
         except:
             pass
 
-        return (0, 0)  # Default if unable to determine
+        if size != (0, 0):
+            self._resolution_cache[key] = size  # Failures are retried on the next filter pass
+        return size
 
     def _on_gallery_resize(self, event) -> None:
         """Handle gallery canvas resize to re-layout thumbnails"""
-        # Check if width actually changed significantly
-        if not hasattr(self, '_last_canvas_width'):
-            self._last_canvas_width = 0
-
-        new_width = self.gallery_canvas.winfo_width()
-        if abs(new_width - self._last_canvas_width) < 50:  # Ignore small changes
+        # Only a change in column count moves any card
+        new_cols = max(1, self.gallery_canvas.winfo_width() // self._GALLERY_CARD_WIDTH)
+        if new_cols == self._last_cols:
             return
 
-        self._last_canvas_width = new_width
-
         if hasattr(self, '_resize_after_id'):
             # Cancel previous scheduled re-layout
             self.root.after_cancel(self._resize_after_id)
@@ -2350,40 +2693,171 @@ OPENWEATHER_API_KEY={openweather_key}
         if not hasattr(self, 'cached_entries') or not self.cached_entries:
             return
 
-        # Clear existing thumbnails
-        for widget in self.gallery_frame.winfo_children():
-            widget.destroy()
-
         # Calculate number of columns based on canvas width
-        # Each thumbnail card is ~270px wide (250px + 20px padding)
         canvas_width = self.gallery_canvas.winfo_width()
         if canvas_width < 100:  # Canvas not yet sized
             canvas_width = 1000  # Default width
 
-        card_width = 270
-        max_cols = max(1, canvas_width // card_width)
+        max_cols = max(1, canvas_width // self._GALLERY_CARD_WIDTH)
+        self._last_cols = max_cols
+
+        logger.debug("Gallery width: %dpx, Columns: %d", canvas_width, max_cols)
+
+        # Same entries as last layout: just move the existing cards
+        if len(self._thumb_cards) == len(self.cached_entries):
+            for idx, card in enumerate(self._thumb_cards):
+                card.grid_configure(row=idx // max_cols, column=idx % max_cols)
+            self.root.after_idle(self._fill_visible_cards)
+            return
 
-        print(f"Gallery width: {canvas_width}px, Columns: {max_cols}")
+        # Clear existing thumbnails
+        self._reset_gallery_frame()
 
         # Create grid of thumbnails
         row = 0
         col = 0
 
         for idx, entry in enumerate(self.cached_entries):
-            self._create_thumbnail(entry, row, col)
+            card = self._create_thumbnail(entry, row, col)
+            self._thumb_cards.append(card)
+            self._pending_cards.append((card, entry))
             col += 1
             if col >= max_cols:
                 col = 0
                 row += 1
 
-    def _create_thumbnail(self, entry: Dict[str, Any], row: int, col: int) -> None:
-        """Create a modern thumbnail card widget for a wallpaper"""
+        # Build card contents once geometry is known, starting with the visible ones
+        self.root.after_idle(self._fill_visible_cards)
+
+    def _on_gallery_yscroll(self, first: str, last: str) -> None:
+        """Canvas yscrollcommand: move the scrollbar and build cards that scrolled into view"""
+        self._gallery_scrollbar.set(first, last)
+        if self._pending_cards:
+            self._fill_visible_cards()
+
+    def _fill_visible_cards(self) -> None:
+        """Build the contents of placeholder cards within one card height of the viewport"""
+        if not self._pending_cards:
+            return
+        margin = self._CARD_PLACEHOLDER_SIZE[1]
+        top = self.gallery_canvas.canvasy(0) - margin
+        bottom = top + self.gallery_canvas.winfo_height() + 2 * margin
+        still_pending = []
+        for card, entry in self._pending_cards:
+            if not card.winfo_exists():
+                continue
+            y = card.winfo_y()
+            if y + card.winfo_height() >= top and y <= bottom:
+                self._fill_thumbnail(card, entry)
+            else:
+                still_pending.append((card, entry))
+        self._pending_cards = still_pending
+
+    def _thumb_cache_path(self, image_path: str) -> Path:
+        """Disk cache file for an image's thumbnail; changes whenever the source file does"""
+        stat = os.stat(image_path)
+        key = f"{image_path}:{stat.st_mtime_ns}:{stat.st_size}:320x180"
+        return self._thumb_dir / (hashlib.sha1(key.encode("utf-8")).hexdigest() + ".png")
+
+    def _prune_thumb_dir(self, image_paths: List[str]) -> None:
+        """Worker thread: delete disk thumbnails of wallpapers that were evicted or rewritten"""
+        keep = set()
+        for image_path in image_paths:
+            try:
+                keep.add(self._thumb_cache_path(image_path).name)
+            except OSError:
+                pass  # Source already gone; its thumbnail goes too
+        try:
+            with os.scandir(self._thumb_dir) as it:
+                for entry in it:
+                    if entry.name not in keep:
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass  # Retried on the next refresh
+        except OSError:
+            pass  # No thumbnail folder yet
+
+    def _decode_thumbnail(self, image_path: str) -> Tuple[Any, Tuple[int, int]]:
+        """Load and resize an image, reusing the disk thumbnail cache; safe to call off the Tk thread"""
+        thumb_path = self._thumb_cache_path(image_path)
+        if thumb_path.exists():
+            try:
+                img = Image.open(thumb_path)
+                img.load()
+                width, height = img.text["original_size"].split("x")
+                return img, (int(width), int(height))
+            except Exception:
+                pass  # Unreadable cache file, regenerate it below
+
+        img = Image.open(image_path)
+        original_size = img.size  # Store original resolution
+
+        # Create larger thumbnail for better visual impact; bilinear is indistinguishable from Lanczos at this size
+        img.thumbnail((320, 180), Image.Resampling.BILINEAR if hasattr(Image, 'Resampling') else Image.BILINEAR)
+
+        try:
+            self._thumb_dir.mkdir(exist_ok=True)
+            info = PngInfo()
+            info.add_text("original_size", f"{original_size[0]}x{original_size[1]}")
+            img.save(thumb_path, "PNG", pnginfo=info)
+        except OSError:
+            pass  # Read-only cache or a mode PNG cannot store; the thumbnail still displays
+        return img, original_size
+
+    def _get_thumb_placeholder(self) -> tk.PhotoImage:
+        """Blank image shown while a thumbnail decodes"""
+        if self._thumb_placeholder is None:
+            self._thumb_placeholder = tk.PhotoImage(width=320, height=180)
+        return self._thumb_placeholder
+
+    def _request_thumbnail(self, image_path: str, img_label: tk.Label, resolution_badge: tk.Label) -> None:
+        """Queue a thumbnail decode; the card's labels are filled in when it finishes"""
+        waiters = self._thumb_waiters.get(image_path)
+        if waiters is not None:
+            waiters.append((img_label, resolution_badge))
+            return
+        self._thumb_waiters[image_path] = [(img_label, resolution_badge)]
+        self._thumb_pool.submit(self._decode_thumbnail_job, image_path)
+
+    def _decode_thumbnail_job(self, image_path: str) -> None:
+        """Worker: decode one thumbnail and hand it to the Tk thread"""
+        try:
+            img, original_size = self._decode_thumbnail(image_path)
+            error = None
+        except Exception as e:
+            img, original_size, error = None, None, e
+        try:
+            self.root.after(0, self._apply_thumbnail, image_path, img, original_size, error)
+        except (RuntimeError, tk.TclError):
+            pass  # Window closed while decoding
+
+    def _apply_thumbnail(self, image_path: str, img, original_size, error) -> None:
+        """Swap a decoded thumbnail into the cards waiting for it (Tk thread)"""
+        waiters = self._thumb_waiters.pop(image_path, [])
+        if error is None:
+            photo = ImageTk.PhotoImage(img)
+            self.thumbnail_cache[self._thumb_key(image_path)] = (photo, original_size)
+        for img_label, resolution_badge in waiters:
+            if not img_label.winfo_exists():
+                continue  # Card was rebuilt or the gallery was cleared
+            if error is not None:
+                img_label.configure(text=f"❌ Error loading image:\n{str(error)[:50]}", fg=self.COLORS['error'])
+                continue
+            img_label.configure(image=photo, text="")
+            img_label.image = photo  # Keep reference
+            resolution_badge.configure(text=f"{original_size[0]}x{original_size[1]}")
+
+    def _create_thumbnail(self, entry: Dict[str, Any], row: int, col: int) -> tk.Frame:
+        """Create an empty thumbnail card; _fill_thumbnail builds its contents when it is scrolled into view"""
         # Create modern card frame with rounded border effect
         card = tk.Frame(self.gallery_frame,
                        bg=self.COLORS['card_bg'],
                        highlightbackground=self.COLORS['border'],
                        highlightthickness=2,
-                       relief=tk.FLAT)
+                       relief=tk.FLAT,
+                       width=self._CARD_PLACEHOLDER_SIZE[0],
+                       height=self._CARD_PLACEHOLDER_SIZE[1])
         card.grid(row=row, column=col, padx=10, pady=10, sticky=tk.NSEW)
 
         # Add hover effect with smooth transition
@@ -2403,34 +2877,36 @@ OPENWEATHER_API_KEY={openweather_key}
 
         card.bind("<Enter>", on_enter)
         card.bind("<Leave>", on_leave)
+        return card
 
+    def _fill_thumbnail(self, card: tk.Frame, entry: Dict[str, Any]) -> None:
+        """Build a card's image, badges and apply button"""
         try:
             # Check if file exists
             image_path = entry.get("path", "")
-            if not image_path or not os.path.exists(image_path):
+            if not image_path or not self._image_exists(image_path):
                 raise FileNotFoundError(f"Image not found: {image_path}")
 
-            # Check thumbnail cache first
-            if image_path in self.thumbnail_cache:
-                photo, original_size = self.thumbnail_cache[image_path]
+            # Check thumbnail cache first; on a miss show a placeholder until the pool decodes it
+            cached = self.thumbnail_cache.get(self._thumb_key(image_path))
+            if cached:
+                photo, original_size = cached
+                resolution_text = f"{original_size[0]}x{original_size[1]}"
             else:
-                # Load and resize image
-                img = Image.open(image_path)
-                original_size = img.size  # Store original resolution
-
-                # Create larger thumbnail for better visual impact
-                img.thumbnail((320, 180), Image.Resampling.LANCZOS if hasattr(Image, 'Resampling') else Image.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-
-                # Cache the thumbnail
-                self.thumbnail_cache[image_path] = (photo, original_size)
+                photo = self._get_thumb_placeholder()
+                if 'width' in entry and 'height' in entry:
+                    resolution_text = f"{entry['width']}x{entry['height']}"
+                else:
+                    resolution_text = "…"
 
             # Image container with dark background
             img_container = tk.Frame(card, bg=self.COLORS['shadow'], relief=tk.FLAT)
             img_container.pack(padx=0, pady=0, fill=tk.BOTH, expand=True)
 
             # Image label
-            img_label = tk.Label(img_container, image=photo, bg=self.COLORS['shadow'])
+            img_label = tk.Label(img_container, image=photo, bg=self.COLORS['shadow'],
+                                 text="" if cached else "Loading...", compound=tk.CENTER,
+                                 fg=self.COLORS['text_muted'])
             img_label.image = photo  # Keep reference
             img_label.pack(padx=5, pady=5)
 
@@ -2443,7 +2919,6 @@ OPENWEATHER_API_KEY={openweather_key}
             badges_row.pack(fill=tk.X, pady=(0, 6))
 
             # Resolution badge - modern pill style
-            resolution_text = f"{original_size[0]}x{original_size[1]}"
             resolution_badge = tk.Label(badges_row, text=resolution_text,
                                        bg=self.COLORS['accent_secondary'],
                                        fg=self.COLORS['shadow'],
@@ -2505,6 +2980,9 @@ OPENWEATHER_API_KEY={openweather_key}
             apply_btn.bind("<Enter>", btn_enter)
             apply_btn.bind("<Leave>", btn_leave)
 
+            if not cached:
+                self._request_thumbnail(image_path, img_label, resolution_badge)
+
         except Exception as e:
             error_label = tk.Label(card, text=f"❌ Error loading image:\n{str(e)[:50]}",
                                   bg=self.COLORS['bg_secondary'],
@@ -2547,18 +3025,7 @@ OPENWEATHER_API_KEY={openweather_key}
         info_label.pack(pady=(0, 20))
 
         # Get available monitors
-        from main import enumerate_monitors_user32, DesktopWallpaperController
-
-        monitors = []
-        try:
-            manager = DesktopWallpaperController()
-            monitors = manager.enumerate_monitors()
-            manager.close()
-        except Exception:
-            try:
-                monitors = enumerate_monitors_user32()
-            except Exception:
-                pass
+        monitors = self._get_monitors()
 
         # Buttons frame
         buttons_frame = tk.Frame(popup, bg=self.COLORS['bg_secondary'])
@@ -2624,47 +3091,59 @@ OPENWEATHER_API_KEY={openweather_key}
             monitor_selection = self.monitor_var.get()
 
         try:
-            from main import WallpaperApp, DesktopWallpaperController, enumerate_monitors_user32
-            import ctypes
-
             wallpaper_path = entry["path"]
 
-            # Convert to BMP if needed
+            # Convert to BMP if needed, reusing a copy that is newer than the source
             if not wallpaper_path.lower().endswith('.bmp'):
-                from pathlib import Path
-                bmp_path = str(Path(wallpaper_path).with_suffix('.bmp'))
-                img = Image.open(wallpaper_path)
-                img.save(bmp_path, 'BMP')
-                wallpaper_path = bmp_path
+                bmp_path = Path(wallpaper_path).with_suffix('.bmp')
+                if not bmp_path.exists() or bmp_path.stat().st_mtime < os.path.getmtime(wallpaper_path):
+                    with Image.open(wallpaper_path) as img:
+                        img.save(bmp_path, 'BMP')
+                wallpaper_path = str(bmp_path)
 
             if monitor_selection == "All Monitors":
                 # Apply to all monitors
-                ctypes.windll.user32.SystemParametersInfoW(20, 0, wallpaper_path, 3)
-                messagebox.showinfo("Success", "Wallpaper applied to all monitors!")
+                # SPI_SETDESKWALLPAPER, SPIF_UPDATEINIFILE | SPIF_SENDWININICHANGE
+                _system_parameters_info()(20, 0, wallpaper_path, 3)
+                self._show_gallery_status("Wallpaper applied to all monitors!")
             else:
                 # Apply to specific monitor
                 # If monitor_idx is passed directly, use it. Otherwise parse from selection string
                 if monitor_idx is None:
                     monitor_idx = int(monitor_selection.split()[1]) - 1
 
+                manager = self._get_wallpaper_controller()
+
                 # Get monitors if not passed
                 if monitors_list is None:
-                    manager = DesktopWallpaperController()
+                    monitors_list = self._get_monitors()
+                if not self._monitors_from_controller:
+                    # user32 ids are HMONITOR handles; set_wallpaper needs the controller's device paths
                     monitors_list = manager.enumerate_monitors()
-                else:
-                    manager = DesktopWallpaperController()
 
                 if monitor_idx < len(monitors_list):
                     manager.set_wallpaper(monitors_list[monitor_idx]["id"], wallpaper_path)
-                    manager.close()
-                    messagebox.showinfo("Success", f"Wallpaper applied to {monitor_selection}!")
+                    self._show_gallery_status(f"Wallpaper applied to {monitor_selection}!")
                 else:
-                    manager.close()
                     messagebox.showerror("Error", "Invalid monitor selection")
 
         except Exception as e:
+            # The shared COM object may be dead; recreate it on the next apply
+            self._close_wallpaper_controller()
             messagebox.showerror("Error", f"Failed to apply wallpaper: {e}")
 
+    def _show_gallery_status(self, text: str) -> None:
+        """Show a success message next to the gallery controls for two seconds"""
+        if self._gallery_status_after_id is not None:
+            self.root.after_cancel(self._gallery_status_after_id)
+        self.gallery_status_label.config(text=f"✓ {text}", foreground=self.COLORS['success'])
+        self._gallery_status_after_id = self.root.after(2000, self._clear_gallery_status)
+
+    def _clear_gallery_status(self) -> None:
+        """Remove the gallery status message"""
+        self._gallery_status_after_id = None
+        self.gallery_status_label.config(text="")
+
     def _change_wallpaper_now(self) -> None:
         """Trigger immediate wallpaper change via main app"""
         try:
@@ -2704,12 +3183,15 @@ OPENWEATHER_API_KEY={openweather_key}
                 loading_window.destroy()
                 return
 
-            # Wait for the change to happen
-            self.root.after(2000, lambda: loading_window.destroy())
-            self.root.after(2500, lambda: messagebox.showinfo("Success",
-                "Wallpaper change triggered!\n\n"
-                "Check the Logs tab for details."))
-            self.root.after(1200, lambda: self._update_provider_info(schedule_next=False))
+            # Wait for the change to happen, then finish in one scheduled callback
+            def finish_change() -> None:
+                self._update_provider_info(schedule_next=False)
+                loading_window.destroy()
+                messagebox.showinfo("Success",
+                    "Wallpaper change triggered!\n\n"
+                    "Check the Logs tab for details.")
+
+            self.root.after(2000, finish_change)
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to change wallpaper: {e}")
@@ -2719,11 +3201,14 @@ OPENWEATHER_API_KEY={openweather_key}
         result = messagebox.askyesno("Confirm", "Are you sure you want to clear the cache?")
         if result:
             try:
-                import shutil
-                if os.path.exists(self.cache_manager.cache_dir):
-                    shutil.rmtree(self.cache_manager.cache_dir)
-                    os.makedirs(self.cache_manager.cache_dir)
-                messagebox.showinfo("Success", "Cache cleared successfully!")
+                failures = self.cache_manager.clear()
+                self.thumbnail_cache.clear()
+                if failures:
+                    messagebox.showwarning("Cache Partially Cleared",
+                                           f"{len(failures)} item(s) could not be deleted:\n\n"
+                                           + "\n".join(failures[:10]))
+                else:
+                    messagebox.showinfo("Success", "Cache cleared successfully!")
                 self._refresh_gallery()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to clear cache: {e}")
@@ -2731,16 +3216,16 @@ OPENWEATHER_API_KEY={openweather_key}
     def _save_config(self) -> None:
         """Save configuration to config.py"""
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+            lines = self._read_config_text().splitlines(keepends=True)
 
             # Prepare advanced structures
             try:
                 playlists_literal: Any = self.playlists_data or []
-                if hasattr(self, 'playlists_text'):
-                    raw_playlists = self.playlists_text.get('1.0', tk.END).strip()
+                playlists_editor = self._widgets.get('playlists_text')
+                if playlists_editor is not None:
+                    raw_playlists = playlists_editor.get('1.0', tk.END).strip()
                     if raw_playlists:
-                        playlists_literal = ast.literal_eval(raw_playlists)
+                        playlists_literal = _parse_literal(raw_playlists)
                     else:
                         playlists_literal = []
                 if not isinstance(playlists_literal, list):
@@ -2753,10 +3238,11 @@ OPENWEATHER_API_KEY={openweather_key}
                 weather_conditions: Any = {}
                 if isinstance(self.weather_settings, dict):
                     weather_conditions = self.weather_settings.get('conditions') or {}
-                if hasattr(self, 'weather_conditions_text'):
-                    raw_conditions = self.weather_conditions_text.get('1.0', tk.END).strip()
+                conditions_editor = self._widgets.get('weather_conditions_text')
+                if conditions_editor is not None:
+                    raw_conditions = conditions_editor.get('1.0', tk.END).strip()
                     if raw_conditions:
-                        weather_conditions = ast.literal_eval(raw_conditions)
+                        weather_conditions = _parse_literal(raw_conditions)
                     else:
                         weather_conditions = {}
                 if not isinstance(weather_conditions, dict):
@@ -2770,17 +3256,14 @@ OPENWEATHER_API_KEY={openweather_key}
                 {
                     "enabled": bool(self.weather_enabled_var.get() if hasattr(self, 'weather_enabled_var') else weather_settings.get('enabled', False)),
                     "provider": self.weather_provider_var.get().strip() if hasattr(self, 'weather_provider_var') else weather_settings.get("provider", "openweathermap"),
-                    "api_key": 'os.getenv("OPENWEATHER_API_KEY", "")',  # Use os.getenv to read from .env
+                    "api_key": _RawCode('os.getenv("OPENWEATHER_API_KEY", "")'),  # Use os.getenv to read from .env
                     "refresh_minutes": max(1, int(self.weather_refresh_var.get() if hasattr(self, 'weather_refresh_var') else weather_settings.get("refresh_minutes", 30) or 30)),
                     "units": self.weather_units_var.get().strip() if hasattr(self, 'weather_units_var') else weather_settings.get("units", "metric"),
                 }
             )
 
-            apply_on: List[str] = []
-            if hasattr(self, 'weather_apply_on_vars'):
-                for trigger, var in self.weather_apply_on_vars.items():
-                    if var.get():
-                        apply_on.append(trigger)
+            if hasattr(self, '_trigger_vars'):
+                apply_on: List[str] = [trigger for trigger, var in zip(self._TRIGGERS, self._trigger_vars) if var.get()]
             else:
                 apply_on = weather_settings.get("apply_on", []) or []
             weather_settings["apply_on"] = apply_on
@@ -2805,22 +3288,67 @@ OPENWEATHER_API_KEY={openweather_key}
             weather_settings["location"] = location
             weather_settings["conditions"] = weather_conditions
 
+            # Values patched into an existing WeatherRotationSettings block, read from Tk once
+            enabled_val = weather_settings["enabled"]
+            refresh_val = weather_settings["refresh_minutes"]
+            units_val = weather_settings["units"]
+            city_val = self.weather_city_var.get() if hasattr(self, 'weather_city_var') else "Milan"
+            country_val = self.weather_country_var.get() if hasattr(self, 'weather_country_var') else "IT"
+            lat_val = location.get("latitude", 45.4642)
+            lon_val = location.get("longitude", 9.19)
+
             default_playlist_value = ""
             if hasattr(self, 'default_playlist_display_var'):
                 selection = self.default_playlist_display_var.get().strip()
                 default_playlist_value = "" if selection in {"", "(None)"} else selection
 
             playlists_block = "Playlists = " + self._format_python_literal(playlists_literal)
-            weather_block_raw = self._format_python_literal(weather_settings)
-            # Fix: os.getenv() should not be quoted - replace the quoted version with executable code
-            weather_block_raw = weather_block_raw.replace('"os.getenv(\\"OPENWEATHER_API_KEY\\", \\"\\")"', 'os.getenv("OPENWEATHER_API_KEY", "")')
-            weather_block_raw = weather_block_raw.replace("'os.getenv(\"OPENWEATHER_API_KEY\", \"\")'", 'os.getenv("OPENWEATHER_API_KEY", "")')
-            weather_block = "WeatherRotationSettings = " + weather_block_raw
+            weather_block = "WeatherRotationSettings = " + self._format_python_literal(weather_settings)
+
+            # Flat top-level assignments, rewritten from their Tk variables
+            default_preset = self.default_preset_var.get() if hasattr(self, 'default_preset_var') else "workspace"
+            top_level_writers = {
+                "Provider": lambda: f'Provider = "{self.provider_var.get()}"\n',
+                "Query": lambda: f'Query = "{self.query_var.get()}"\n',
+                "PurityLevel": lambda: f'PurityLevel = "{self.purity_var.get()}"\n',
+                "ScreenResolution": lambda: f'ScreenResolution = "{self.resolution_var.get()}"\n',
+                "WallhavenSorting": lambda: f'WallhavenSorting = "{self.sorting_var.get()}"\n',
+                "WallhavenTopRange": lambda: f'WallhavenTopRange = "{self.toprange_var.get()}"\n',
+                "PexelsMode": lambda: f'PexelsMode = "{self.pexels_mode_var.get()}"\n',
+                "RotateProviders": lambda: f'RotateProviders = {self.rotate_providers_var.get()}\n',
+                "KeyBind": lambda: f'KeyBind = "{self.keybind_var.get()}"\n',
+                "DefaultPreset": lambda: f'DefaultPreset = "{default_preset}"\n',
+            }
+            # Keys rewritten inside the top-level dicts, per dict
+            cache_path = self.cache_dir_var.get() if hasattr(self, 'cache_dir_var') else ""
+            section_writers = {
+                "RedditSettings": {
+                    "subreddits": lambda: f'    "subreddits": {json.dumps([s.strip() for s in self.reddit_subreddits_var.get().split(",") if s.strip()] or ["wallpapers"])},\n',
+                    "sort": lambda: f'    "sort": {json.dumps(self.reddit_sort_var.get().strip().lower() or "hot")},\n',
+                    "time_filter": lambda: f'    "time_filter": {json.dumps(self.reddit_time_var.get().strip().lower() or "day")},\n',
+                    "limit": lambda: f'    "limit": {max(10, min(100, int(self.reddit_limit_var.get() or 60)))},\n',
+                    "min_score": lambda: f'    "min_score": {max(0, int(self.reddit_score_var.get() or 0))},\n',
+                    "allow_nsfw": lambda: f'    "allow_nsfw": {self.reddit_nsfw_var.get()},\n',
+                    "user_agent": lambda: f'    "user_agent": {json.dumps(self.reddit_user_agent_var.get().strip() or "WallpaperChanger/1.0 (by u/yourusername)")},\n',
+                },
+                "SchedulerSettings": {
+                    "enabled": lambda: f'    "enabled": {self.scheduler_enabled_var.get()},\n',
+                    "interval_minutes": lambda: f'    "interval_minutes": {self.interval_var.get()},\n',
+                    "jitter_minutes": lambda: f'    "jitter_minutes": {self.jitter_var.get()},\n',
+                    "initial_delay_minutes": lambda: f'    "initial_delay_minutes": {self.initial_delay_var.get()},\n',
+                },
+                "CacheSettings": {
+                    "max_items": lambda: f'    "max_items": {self.cache_max_var.get()},\n',
+                    "enable_offline_rotation": lambda: f'    "enable_offline_rotation": {self.cache_offline_var.get()},\n',
+                    # Use raw string prefix for Windows paths
+                    "directory": lambda: f'    "directory": r"{cache_path}",\n',
+                },
+            }
 
-            new_lines: List[str] = []
+            buf = io.StringIO()
             in_monitors_section = False
             monitor_entry_counter = -1
-            in_reddit_section = False
+            section: Optional[str] = None  # Key of the section_writers dict being patched
             skip_playlists = False
             skip_weather = False
             in_weather_location = False
@@ -2831,10 +3359,11 @@ OPENWEATHER_API_KEY={openweather_key}
 
             for line in lines:
                 stripped = line.strip()
+                indent = line[:len(line) - len(line.lstrip())]
 
                 if skip_playlists:
                     # Preserve original playlist lines
-                    new_lines.append(line)
+                    buf.write(line)
                     if stripped.startswith("]"):
                         skip_playlists = False
                     continue
@@ -2842,58 +3371,28 @@ OPENWEATHER_API_KEY={openweather_key}
                     # Track if we're inside the "location" sub-dict
                     if '"location":' in line and '{' in line:
                         in_weather_location = True
-                        new_lines.append(line)
+                        buf.write(line)
                         # Continue to skip further processing of this line
                     # Update specific weather settings fields that GUI can modify
                     elif '"enabled":' in line:
-                        indent = line[:len(line) - len(line.lstrip())]
-                        enabled_val = self.weather_enabled_var.get() if hasattr(self, 'weather_enabled_var') else True
-                        new_lines.append(f'{indent}"enabled": {enabled_val},\n')
+                        buf.write(f'{indent}"enabled": {enabled_val},\n')
                     elif '"refresh_minutes":' in line:
-                        indent = line[:len(line) - len(line.lstrip())]
-                        refresh_val = int(self.weather_refresh_var.get()) if hasattr(self, 'weather_refresh_var') else 30
-                        new_lines.append(f'{indent}"refresh_minutes": {refresh_val},\n')
+                        buf.write(f'{indent}"refresh_minutes": {refresh_val},\n')
                     elif '"units":' in line:
-                        indent = line[:len(line) - len(line.lstrip())]
-                        units_val = self.weather_units_var.get() if hasattr(self, 'weather_units_var') else "metric"
-                        new_lines.append(f'{indent}"units": "{units_val}",\n')
+                        buf.write(f'{indent}"units": "{units_val}",\n')
                     elif '"apply_on":' in line:
-                        indent = line[:len(line) - len(line.lstrip())]
-                        apply_on = []
-                        if hasattr(self, 'weather_apply_on_vars'):
-                            for trigger, var in self.weather_apply_on_vars.items():
-                                if var.get():
-                                    apply_on.append(trigger)
-                        else:
-                            apply_on = ["startup", "scheduler", "hotkey"]
-                        new_lines.append(f'{indent}"apply_on": {apply_on},\n')
+                        buf.write(f'{indent}"apply_on": {apply_on},\n')
                     elif in_weather_location and '"city":' in line:
-                        indent = line[:len(line) - len(line.lstrip())]
-                        city_val = self.weather_city_var.get() if hasattr(self, 'weather_city_var') else "Milan"
-                        new_lines.append(f'{indent}"city": "{city_val}",\n')
+                        buf.write(f'{indent}"city": "{city_val}",\n')
                     elif in_weather_location and '"country":' in line:
-                        indent = line[:len(line) - len(line.lstrip())]
-                        country_val = self.weather_country_var.get() if hasattr(self, 'weather_country_var') else "IT"
-                        new_lines.append(f'{indent}"country": "{country_val}",\n')
+                        buf.write(f'{indent}"country": "{country_val}",\n')
                     elif in_weather_location and '"latitude":' in line:
-                        indent = line[:len(line) - len(line.lstrip())]
-                        lat_val = self.weather_lat_var.get() if hasattr(self, 'weather_lat_var') else "45.4642"
-                        try:
-                            lat_val = float(lat_val) if lat_val else 45.4642
-                        except:
-                            lat_val = 45.4642
-                        new_lines.append(f'{indent}"latitude": {lat_val},\n')
+                        buf.write(f'{indent}"latitude": {lat_val},\n')
                     elif in_weather_location and '"longitude":' in line:
-                        indent = line[:len(line) - len(line.lstrip())]
-                        lon_val = self.weather_lon_var.get() if hasattr(self, 'weather_lon_var') else "9.19"
-                        try:
-                            lon_val = float(lon_val) if lon_val else 9.19
-                        except:
-                            lon_val = 9.19
-                        new_lines.append(f'{indent}"longitude": {lon_val},\n')
+                        buf.write(f'{indent}"longitude": {lon_val},\n')
                     else:
                         # Keep other lines as-is (api_key, provider, conditions, etc.)
-                        new_lines.append(line)
+                        buf.write(line)
 
                     # Check if we're exiting the location block
                     if in_weather_location and stripped.startswith("},"):
@@ -2904,149 +3403,128 @@ OPENWEATHER_API_KEY={openweather_key}
                         skip_weather = False
                     continue
 
-                if stripped.startswith("Provider ="):
-                    new_lines.append(f'Provider = "{self.provider_var.get()}"\n')
-                elif stripped.startswith("Query ="):
-                    new_lines.append(f'Query = "{self.query_var.get()}"\n')
-                elif stripped.startswith("PurityLevel ="):
-                    new_lines.append(f'PurityLevel = "{self.purity_var.get()}"\n')
-                elif stripped.startswith("ScreenResolution ="):
-                    new_lines.append(f'ScreenResolution = "{self.resolution_var.get()}"\n')
-                elif stripped.startswith("WallhavenSorting ="):
-                    new_lines.append(f'WallhavenSorting = "{self.sorting_var.get()}"\n')
-                elif stripped.startswith("WallhavenTopRange ="):
-                    new_lines.append(f'WallhavenTopRange = "{self.toprange_var.get()}"\n')
-                elif stripped.startswith("PexelsMode ="):
-                    new_lines.append(f'PexelsMode = "{self.pexels_mode_var.get()}"\n')
-                elif stripped.startswith("RotateProviders ="):
-                    new_lines.append(f'RotateProviders = {self.rotate_providers_var.get()}\n')
-                elif stripped.startswith("KeyBind ="):
-                    new_lines.append(f'KeyBind = "{self.keybind_var.get()}"\n')
-                elif stripped.startswith("RedditSettings = {"):
-                    in_reddit_section = True
-                    new_lines.append(line)
-                elif in_reddit_section and '"subreddits":' in line:
-                    subreddits = [s.strip() for s in self.reddit_subreddits_var.get().split(",") if s.strip()]
-                    if not subreddits:
-                        subreddits = ["wallpapers"]
-                    new_lines.append(f'    "subreddits": {json.dumps(subreddits)},\n')
-                elif in_reddit_section and '"sort":' in line:
-                    new_lines.append(f'    "sort": {json.dumps(self.reddit_sort_var.get().strip().lower() or "hot")},\n')
-                elif in_reddit_section and '"time_filter":' in line:
-                    new_lines.append(f'    "time_filter": {json.dumps(self.reddit_time_var.get().strip().lower() or "day")},\n')
-                elif in_reddit_section and '"limit":' in line:
-                    limit_value = max(10, min(100, int(self.reddit_limit_var.get() or 60)))
-                    new_lines.append(f'    "limit": {limit_value},\n')
-                elif in_reddit_section and '"min_score":' in line:
-                    min_score_value = max(0, int(self.reddit_score_var.get() or 0))
-                    new_lines.append(f'    "min_score": {min_score_value},\n')
-                elif in_reddit_section and '"allow_nsfw":' in line:
-                    new_lines.append(f'    "allow_nsfw": {self.reddit_nsfw_var.get()},\n')
-                elif in_reddit_section and '"user_agent":' in line:
-                    user_agent = self.reddit_user_agent_var.get().strip() or "WallpaperChanger/1.0 (by u/yourusername)"
-                    new_lines.append(f'    "user_agent": {json.dumps(user_agent)},\n')
-                elif in_reddit_section and stripped.startswith("}"):
-                    in_reddit_section = False
-                    new_lines.append(line)
-                elif '"enabled":' in line and "SchedulerSettings" in "".join(new_lines[-10:]):
-                    new_lines.append(f'    "enabled": {self.scheduler_enabled_var.get()},\n')
-                elif '"interval_minutes":' in line:
-                    new_lines.append(f'    "interval_minutes": {self.interval_var.get()},\n')
-                elif '"jitter_minutes":' in line:
-                    new_lines.append(f'    "jitter_minutes": {self.jitter_var.get()},\n')
-                elif '"initial_delay_minutes":' in line:
-                    new_lines.append(f'    "initial_delay_minutes": {self.initial_delay_var.get()},\n')
-                elif '"max_items":' in line and "CacheSettings" in "".join(new_lines[-10:]):
-                    new_lines.append(f'    "max_items": {self.cache_max_var.get()},\n')
-                elif '"enable_offline_rotation":' in line:
-                    new_lines.append(f'    "enable_offline_rotation": {self.cache_offline_var.get()},\n')
-                elif '"directory":' in line and "CacheSettings" in "".join(new_lines[-10:]):
-                    cache_path = self.cache_dir_var.get() if hasattr(self, 'cache_dir_var') else ""
-                    # Use raw string prefix for Windows paths
-                    new_lines.append(f'    "directory": r"{cache_path}",\n')
-                elif stripped.startswith("DefaultPreset ="):
-                    default_preset = self.default_preset_var.get() if hasattr(self, 'default_preset_var') else "workspace"
-                    new_lines.append(f'DefaultPreset = "{default_preset}"\n')
-                elif stripped.startswith("DefaultPlaylist ="):
+                # Inside a patched top-level dict, which closes with "}" at column 0
+                if section is not None:
+                    if line.startswith("}"):
+                        section = None
+                        buf.write(line)
+                        continue
+                    dict_key = _DICT_KEY_RE.match(line)
+                    writer = section_writers[section].get(dict_key.group(1)) if dict_key else None
+                    buf.write(writer() if writer is not None else line)
+                    continue
+
+                match = _CONFIG_KEY_RE.match(line)
+                key = match.group(1) if match else None
+
+                writer = top_level_writers.get(key)
+                if writer is not None:
+                    buf.write(writer())
+                elif key in section_writers and stripped.partition("#")[0].rstrip().endswith("{"):
+                    # Header may carry a trailing comment: SchedulerSettings = {  # ...
+                    section = key
+                    buf.write(line)
+                elif key == "DefaultPlaylist":
                     found_default_playlist = True
-                    new_lines.append(f'DefaultPlaylist = "{default_playlist_value}"\n')
-                elif stripped.startswith("Playlists ="):
+                    buf.write(f'DefaultPlaylist = "{default_playlist_value}"\n')
+                elif key == "Playlists":
                     found_playlists = True
                     # Preserve original Playlists section - don't reformat
-                    new_lines.append(line)
+                    buf.write(line)
                     skip_playlists = True
-                elif stripped.startswith("WeatherRotationSettings ="):
+                elif key == "WeatherRotationSettings":
                     found_weather = True
                     # Preserve original WeatherRotationSettings section - don't reformat
-                    new_lines.append(line)
+                    buf.write(line)
                     skip_weather = True
-                elif stripped.startswith("Monitors = ["):
+                elif key == "Monitors":
                     found_monitors = True
                     in_monitors_section = True
                     monitor_entry_counter = -1
-                    new_lines.append(line)
+                    buf.write(line)
                 elif in_monitors_section and stripped == "{":
                     monitor_entry_counter += 1
-                    new_lines.append(line)
+                    buf.write(line)
                 elif in_monitors_section and '"screen_resolution":' in line and hasattr(self, 'monitor_resolution_vars'):
                     if monitor_entry_counter in self.monitor_resolution_vars:
                         resolution = self.monitor_resolution_vars[monitor_entry_counter].get()
-                        indent = line[:len(line) - len(line.lstrip())]
-                        new_lines.append(f'{indent}"screen_resolution": "{resolution}",\n')
+                        buf.write(f'{indent}"screen_resolution": "{resolution}",\n')
                     else:
-                        new_lines.append(line)
+                        buf.write(line)
                 elif in_monitors_section and stripped == "]":
                     in_monitors_section = False
-                    new_lines.append(line)
+                    buf.write(line)
                 else:
-                    new_lines.append(line)
+                    buf.write(line)
 
             # Append missing sections at the end if they weren't found in the original file
             if not found_default_playlist:
-                new_lines.append(f'\nDefaultPlaylist = "{default_playlist_value}"\n')
+                buf.write(f'\nDefaultPlaylist = "{default_playlist_value}"\n')
 
             if not found_playlists:
-                new_lines.append(f'\n{playlists_block}\n')
+                buf.write(f'\n{playlists_block}\n')
 
             if not found_weather:
-                new_lines.append(f'\n{weather_block}\n')
+                buf.write(f'\n{weather_block}\n')
 
             if not found_monitors:
                 # Add default Monitors section
-                new_lines.append('\nMonitors = [\n')
-                new_lines.append('    {\n')
-                new_lines.append('        "name": "Full HD",\n')
-                new_lines.append('        "preset": "workspace",\n')
-                new_lines.append('        "provider": "",\n')
-                new_lines.append('        "query": "",\n')
-                new_lines.append('        "screen_resolution": "1920x1080",\n')
-                new_lines.append('        "purity": "100",\n')
-                new_lines.append('        "wallhaven_sorting": "random",\n')
-                new_lines.append('        "wallhaven_top_range": "1M",\n')
-                new_lines.append('    },\n')
-                new_lines.append(']\n')
-
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                f.writelines(new_lines)
-
-            self.playlists_data = playlists_literal
-            self.weather_settings = weather_settings
-            self.config_data["Playlists"] = playlists_literal
-            self.config_data["WeatherRotationSettings"] = weather_settings
-            self.config_data["DefaultPlaylist"] = default_playlist_value
+                buf.write(_DEFAULT_MONITORS_BLOCK)
 
+            # API keys are written by the same worker, after config.py
+            env_file = None
             if hasattr(self, 'wallhaven_key_var') and hasattr(self, 'pexels_key_var'):
-                self._save_api_keys()
+                env_file = self._env_file_content()
+
+            def on_saved(env_error: Optional[Exception]) -> None:
+                self.playlists_data = playlists_literal
+                self.weather_settings = weather_settings
+                self._update_playlist_names()
+                self.config_data["Playlists"] = playlists_literal
+                self.config_data["WeatherRotationSettings"] = weather_settings
+                self.config_data["DefaultPlaylist"] = default_playlist_value
+                self._literal_format_cache.clear()
+
+                if env_error is not None:
+                    messagebox.showwarning("Partially Saved",
+                                           f"Configuration saved, but the API keys could not be saved: {env_error}\n\n"
+                                           "Restart the application for changes to take effect.")
+                else:
+                    messagebox.showinfo("Success", "Configuration saved successfully!\n\nRestart the application for changes to take effect.")
 
-            messagebox.showinfo("Success", "Configuration saved successfully!\n\nRestart the application for changes to take effect.")
+            # Write off the Tk thread; state updates and dialogs run back on it.
+            # Not a daemon, so quitting waits for the write instead of cutting it off.
+            threading.Thread(target=self._write_config_file, args=(buf.getvalue(), env_file, on_saved)).start()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save configuration: {e}")
 
+    def _write_config_file(self, text: str, env_file: Optional[Tuple[Path, str]],
+                           on_saved: Callable[[Optional[Exception]], None]) -> None:
+        """Worker thread: write config.py and then .env, and report one result on the Tk thread"""
+        try:
+            with self._config_write_lock:
+                _write_file_atomic(self.config_path, text)
+                self._remember_config_text(text)
+            env_error = None
+            if env_file is not None:
+                try:
+                    _write_file_atomic(*env_file)
+                except Exception as e:
+                    env_error = e
+            done = (on_saved, env_error)
+        except Exception as e:
+            done = (messagebox.showerror, "Error", f"Failed to save configuration: {e}")
+        try:
+            self.root.after(0, *done)
+        except (RuntimeError, tk.TclError):
+            pass  # Window closed while saving
+
     def _reload_config(self) -> None:
         """Reload configuration"""
         self._load_config()
         self.playlists_data = list(self.config_data.get("Playlists") or [])
         self.weather_settings = dict(self.config_data.get("WeatherRotationSettings") or {})
+        self._update_playlist_names()
         messagebox.showinfo("Success", "Configuration reloaded!")
 
         # Update basic UI elements
@@ -3056,63 +3534,27 @@ OPENWEATHER_API_KEY={openweather_key}
         self.resolution_var.set(self.config_data.get("ScreenResolution", "1920x1080"))
 
         if hasattr(self, 'default_preset_var'):
-            self.default_preset_var.set(self._extract_value(self._get_config_content(), "DefaultPreset") or "workspace")
+            self.default_preset_var.set(self.config_data.get("DefaultPreset") or "workspace")
 
         # Update playlist selector and summary
         if hasattr(self, 'default_playlist_display_var'):
             raw_default_playlist = (self.config_data.get("DefaultPlaylist") or "").strip()
-            playlist_names: List[str] = []
-            seen = set()
-            for item in self.playlists_data:
-                if isinstance(item, dict):
-                    name = str(item.get("name", "")).strip()
-                    if name and name not in seen:
-                        playlist_names.append(name)
-                        seen.add(name)
-            display_value = raw_default_playlist if raw_default_playlist in playlist_names else "(None)"
+            display_value = raw_default_playlist if raw_default_playlist in self._playlist_names else "(None)"
             self.default_playlist_display_var.set(display_value)
-            if hasattr(self, 'default_playlist_combo'):
-                values = ["(None)"] + playlist_names
-                self.default_playlist_combo['values'] = values
-            if hasattr(self, 'playlist_summary_label'):
-                if playlist_names:
-                    summary_lines = [f"- {name}" for name in playlist_names]
-                    summary_text = "\n".join(summary_lines)
-                else:
-                    summary_text = "No playlists defined yet."
-                self.playlist_summary_label.configure(text=summary_text)
-        if hasattr(self, 'playlists_text'):
-            self._reset_playlists_text()
+        self._reset_playlists_text()
 
         # Update weather controls
         if isinstance(self.weather_settings, dict):
-            location = self.weather_settings.get("location", {}) or {}
             apply_on = set(self.weather_settings.get("apply_on", []) or [])
-            if hasattr(self, 'weather_enabled_var'):
-                self.weather_enabled_var.set(bool(self.weather_settings.get("enabled", False)))
-            if hasattr(self, 'weather_provider_var'):
-                self.weather_provider_var.set(str(self.weather_settings.get("provider", "openweathermap") or "openweathermap"))
+            for attr, _, value in self._weather_var_values():
+                if hasattr(self, attr):
+                    getattr(self, attr).set(value)
             if hasattr(self, 'weather_api_key_var'):
                 self.weather_api_key_var.set(str(self.weather_settings.get("api_key", "") or ""))
-            if hasattr(self, 'weather_refresh_var'):
-                self.weather_refresh_var.set(int(self.weather_settings.get("refresh_minutes", 30) or 30))
-            if hasattr(self, 'weather_units_var'):
-                self.weather_units_var.set(str(self.weather_settings.get("units", "metric") or "metric"))
-            if hasattr(self, 'weather_city_var'):
-                self.weather_city_var.set(str(location.get("city", "") or ""))
-            if hasattr(self, 'weather_country_var'):
-                self.weather_country_var.set(str(location.get("country", "") or ""))
-            if hasattr(self, 'weather_lat_var'):
-                latitude = location.get("latitude", "")
-                self.weather_lat_var.set("" if latitude in (None, "") else str(latitude))
-            if hasattr(self, 'weather_lon_var'):
-                longitude = location.get("longitude", "")
-                self.weather_lon_var.set("" if longitude in (None, "") else str(longitude))
-            if hasattr(self, 'weather_apply_on_vars'):
-                for trigger, var in self.weather_apply_on_vars.items():
+            if hasattr(self, '_trigger_vars'):
+                for trigger, var in zip(self._TRIGGERS, self._trigger_vars):
                     var.set(trigger in apply_on)
-        if hasattr(self, 'weather_conditions_text'):
-            self._reset_weather_conditions_text()
+        self._reset_weather_conditions_text()
 
 
 
@@ -1,5 +1,6 @@
 """Test script to verify cache and image loading"""
 import os
+import tempfile
 from PIL import Image
 from cache_manager import CacheManager
 from config import CacheSettings
@@ -57,5 +58,30 @@ def test_cache():
 
     print("\n" + "=" * 60)
 
+def test_clear():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, "cache")
+        cache_manager = CacheManager(cache_dir, enable_duplicate_detection=False)
+
+        image_path = os.path.join(cache_dir, "1_1000.jpg")
+        Image.new("RGB", (8, 8)).save(image_path)
+        os.makedirs(os.path.join(cache_dir, ".thumbs"))
+        Image.new("RGB", (4, 4)).save(os.path.join(cache_dir, ".thumbs", "thumb.png"))
+
+        # An entry whose file is not removed by clear() must stay in the index
+        outside_path = os.path.join(tmp, "kept.jpg")
+        Image.new("RGB", (8, 8)).save(outside_path)
+        cache_manager._index["items"] = [{"path": image_path}, {"path": outside_path}]
+        cache_manager._save()
+
+        failures = cache_manager.clear()
+
+        assert failures == []
+        assert sorted(os.listdir(cache_dir)) == ["index.json"]
+        assert [e["path"] for e in cache_manager.list_entries()] == [outside_path]
+        assert [e["path"] for e in CacheManager(cache_dir).list_entries()] == [outside_path]
+        print("✓ clear() empties the folder and keeps the index in sync")
+
 if __name__ == "__main__":
     test_cache()
+    test_clear()
@@ -0,0 +1,79 @@
+"""Test script to verify config.py parsing and literal formatting used by the settings GUI"""
+import ast
+import os
+
+import config
+from gui_config import _RawCode, _dump_literal, _entries_key, _parse_config_literals, _parse_literal
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(config.__file__)), "config.py")
+
+
+def test_parse_stock_config():
+    with open(CONFIG_PATH, "r", encoding="utf-8") as handle:
+        values = _parse_config_literals(handle.read())
+
+    for name in ("SchedulerSettings", "CacheSettings", "RedditSettings", "Monitors",
+                 "Provider", "Presets", "Playlists", "DefaultPreset"):
+        assert values[name] == getattr(config, name), name
+
+    # Assignments that are not literals are skipped rather than guessed
+    assert "ApiKey" not in values
+    assert "WeatherRotationSettings" not in values
+    print(f"✓ Parsed {len(values)} literal settings from config.py")
+
+
+def test_dump_literal_round_trip():
+    value = {
+        "enabled": True,
+        "interval_minutes": 45,
+        "subreddits": ["wallpapers", "earthporn", "spaceporn", "cityporn", "ArtPorn", "MinimalWallpaper"],
+        "nested": {"weights": (1, 2.5, None), "label": "it's \"quoted\""},
+    }
+    dumped = _dump_literal(value)
+    assert "\n" in dumped  # Too wide for one line, so it is broken up
+    assert ast.literal_eval(dumped) == value
+    assert _parse_literal(dumped) == value
+
+    assert _dump_literal([1, 2]) == "[1, 2]"
+    assert _dump_literal({}) == "{}"
+    print("✓ _dump_literal output round-trips")
+
+
+def test_dump_raw_code():
+    dumped = _dump_literal({"api_key": _RawCode('os.getenv("OPENWEATHER_API_KEY", "")'), "units": "metric"})
+    assert dumped == "{'api_key': os.getenv(\"OPENWEATHER_API_KEY\", \"\"), 'units': 'metric'}"
+
+    # Written out as code, read back as a non-literal assignment
+    source = f"WeatherRotationSettings = {dumped}\n"
+    assert _parse_config_literals(source) == {}
+    assert eval(dumped, {"os": os})["units"] == "metric"
+    print("✓ _RawCode is written verbatim")
+
+
+def test_parse_literal():
+    assert _parse_literal('[{"name": "Work", "enabled": true}]') == [{"name": "Work", "enabled": True}]
+    assert _parse_literal("[{'name': 'Work', 'enabled': True}]") == [{"name": "Work", "enabled": True}]
+    for raw in ("[NaN]", '{"x": Infinity}', "[-Infinity]"):
+        try:
+            _parse_literal(raw)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{raw} should be rejected")
+    print("✓ _parse_literal accepts JSON and Python literals")
+
+
+def test_entries_key():
+    entries = [{"path": "a.jpg", "source_info": "r/wallpapers"}, {"path": "b.jpg"}]
+    assert _entries_key(entries) == (("a.jpg", "r/wallpapers"), ("b.jpg", ""))
+    assert _entries_key([dict(e) for e in entries]) == _entries_key(entries)
+    assert _entries_key(entries[::-1]) != _entries_key(entries)
+    print("✓ _entries_key tracks paths, sources and order")
+
+
+if __name__ == "__main__":
+    test_parse_stock_config()
+    test_dump_literal_round_trip()
+    test_dump_raw_code()
+    test_parse_literal()
+    test_entries_key()